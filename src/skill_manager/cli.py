@@ -359,7 +359,9 @@ def list(
             registry = SkillRegistry(target_dir)
             registry.load()
 
-            skills = registry.list_skills()
+            skills = registry.list_skill_fields(
+                "name", "description", "installed_at", default=""
+            )
 
             if not skills:
                 print_info("No skills installed")
@@ -372,11 +374,7 @@ def list(
             table.add_column("Description")
             table.add_column("Installed At")
 
-            for skill in skills:
-                name = skill.get("name", "")
-                desc = skill.get("description", "")
-                installed = skill.get("installed_at", "")
-
+            for name, desc, installed in skills:
                 # Format timestamp
                 if installed:
                     try:
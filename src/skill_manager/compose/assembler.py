@@ -25,7 +25,11 @@ from skill_manager.config.schema import (
     SkillConfig,
     SkillManagerConfig,
 )
-from skill_manager.core.resolver import resolve_compose_item, ResolvedSource
+from skill_manager.core.resolver import (
+    resolve_compose_item,
+    resolve_compose_items,
+    ResolvedSource,
+)
 from skill_manager.core.skill import Skill, SkillSource
 from skill_manager.fetch.cache import SkillCache
 from skill_manager.fetch.github import GitHubFetcher
@@ -41,11 +45,14 @@ class AssemblyContext:
         config: The skill manager configuration
         cache: Cache for downloaded skills
         github_token: Optional GitHub token for authenticated requests
+        fetcher: Optional shared GitHub fetcher; when unset, each GitHub
+            fetch uses a short-lived fetcher of its own
     """
 
     config: SkillManagerConfig
     cache: SkillCache
     github_token: Optional[str] = None
+    fetcher: Optional[GitHubFetcher] = None
 
 
 async def assemble_skill(
@@ -175,14 +182,14 @@ async def _assemble_composed_skill(
     source_skills: list[tuple[SkillSource, PrecedenceLevel]] = []
     source_names: list[str] = []
 
-    for compose_item in skill_config.compose:
-        # Resolve the compose item
-        resolved = resolve_compose_item(
-            compose_item,
-            context.config.sources,
-            context.config.settings.default_branch,
-        )
+    # Resolve all compose items up front, sharing named-source lookups
+    resolved_items = resolve_compose_items(
+        skill_config.compose,
+        context.config.sources,
+        context.config.settings.default_branch,
+    )
 
+    for compose_item, resolved in zip(skill_config.compose, resolved_items):
         # Fetch the source
         skill_source = await _fetch_source(resolved, context, force_refresh)
 
@@ -276,8 +283,9 @@ async def _fetch_source(
                 print_info(f"  Using cached skill: {cached.name}")
                 return cached
 
-        # Fetch from GitHub
-        fetcher = GitHubFetcher(token=context.github_token)
+        # Fetch from GitHub, reusing the context's fetcher (and its
+        # connection pool) when one was provided
+        fetcher = context.fetcher or GitHubFetcher(token=context.github_token)
 
         # Create a temporary directory for fetching
         import tempfile
@@ -286,7 +294,11 @@ async def _fetch_source(
             temp_path = Path(temp_dir) / path.split("/")[-1]
 
             print_info(f"  Fetching from GitHub: {owner}/{repo}/{path}@{ref}")
-            skill_source = await fetcher.fetch(owner, repo, path, ref, temp_path)
+            try:
+                skill_source = await fetcher.fetch(owner, repo, path, ref, temp_path)
+            finally:
+                if fetcher is not context.fetcher:
+                    await fetcher.aclose()
 
             # Cache the skill (copy to cache before returning)
             try:
@@ -344,26 +356,29 @@ async def assemble_all_skills(
     cache_dir = expand_path(config.settings.cache_dir)
     cache = SkillCache(cache_dir)
 
-    # Create assembly context
-    context = AssemblyContext(
-        config=config,
-        cache=cache,
-        github_token=github_token,
-    )
-
     # Assemble all skills
     installed_skills: list[Skill] = []
     errors: list[tuple[str, Exception]] = []
 
-    for skill_config in config.skills:
-        try:
-            skill = await assemble_skill(
-                skill_config, context, target_dir, force_refresh
-            )
-            installed_skills.append(skill)
-        except Exception as e:
-            errors.append((skill_config.name, e))
-            print_error(f"Failed to assemble skill {skill_config.name}: {e}")
+    # One fetcher for the whole run, so GitHub connections are reused
+    async with GitHubFetcher(token=github_token) as fetcher:
+        # Create assembly context
+        context = AssemblyContext(
+            config=config,
+            cache=cache,
+            github_token=github_token,
+            fetcher=fetcher,
+        )
+
+        for skill_config in config.skills:
+            try:
+                skill = await assemble_skill(
+                    skill_config, context, target_dir, force_refresh
+                )
+                installed_skills.append(skill)
+            except Exception as e:
+                errors.append((skill_config.name, e))
+                print_error(f"Failed to assemble skill {skill_config.name}: {e}")
 
     # Report summary
     console.print()
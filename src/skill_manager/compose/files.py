@@ -1,14 +1,28 @@
 """File composer for non-markdown files in skills."""
 
+import errno
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from skill_manager.config.schema import PrecedenceLevel
-from skill_manager.core.skill import SkillSource
+from skill_manager.core.skill import MARKDOWN_SUFFIXES, SkillSource
+from skill_manager.utils.paths import walk_files
+
+# os.link failures that mean "linking is not possible here", so copy instead
+_LINK_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP}
+)
+
+# Below this many files, thread pool start-up costs more than it saves
+_PARALLEL_COPY_THRESHOLD = 16
 
 
 def compose_non_markdown_files(
-    sources: list[tuple[SkillSource, PrecedenceLevel]], output_dir: Path
+    sources: list[tuple[SkillSource, PrecedenceLevel]],
+    output_dir: Path,
+    use_hardlinks: bool = False,
 ) -> dict[str, str]:
     """Compose non-markdown files from multiple sources.
 
@@ -19,6 +33,11 @@ def compose_non_markdown_files(
     Args:
         sources: List of (SkillSource, precedence_level) tuples
         output_dir: Directory where files should be written
+        use_hardlinks: If True, hard-link files into output_dir instead of
+                      copying them, falling back to a copy where linking is
+                      not possible (e.g. across filesystems). Linked files
+                      share storage with the source, so only enable this
+                      when the output will not be edited in place.
 
     Returns:
         Dict mapping output file path to source description
@@ -27,55 +46,125 @@ def compose_non_markdown_files(
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Group files by relative path and precedence level
-    # Key: relative path, Value: dict with 'user' and 'default' entries
-    files_by_path: dict[str, dict[str, tuple[Path, SkillSource]]] = {}
+    # Winning file per relative path: (source file, source skill, level)
+    chosen: dict[str, tuple[str, SkillSource, str]] = {}
+    # Relative paths already claimed by a user-level source; nothing can
+    # displace these, so later candidates for them are skipped outright
+    user_claimed: set[str] = set()
 
-    # Collect all non-markdown files from all sources
+    # Collect all non-markdown files from all sources, staying in str paths;
+    # walk_files gets the file/dir split from scandir without extra stats
     for skill_source, precedence_level in sources:
-        non_md_files = skill_source.get_non_markdown_files()
-
-        for file_path in non_md_files:
-            # Calculate relative path from skill root
-            rel_path = file_path.relative_to(skill_source.path)
-
-            # Initialize dict for this path if needed
-            if str(rel_path) not in files_by_path:
-                files_by_path[str(rel_path)] = {}
-
-            # Store file by precedence level (user or default)
-            # First occurrence wins for same precedence level
-            level_key = precedence_level.value  # 'user' or 'default'
-            if level_key not in files_by_path[str(rel_path)]:
-                files_by_path[str(rel_path)][level_key] = (file_path, skill_source)
+        level_key = precedence_level.value  # 'user' or 'default'
+        root = str(skill_source.path)
+        last_dirpath = None
+
+        for dirpath, filename in walk_files(root):
+            if os.path.splitext(filename)[1].lower() in MARKDOWN_SUFFIXES:
+                continue
+
+            # Files arrive grouped by directory, so relpath runs once per directory
+            if dirpath != last_dirpath:
+                # Relative directory from skill root ('.' for the root itself)
+                rel_dir = os.path.relpath(dirpath, root)
+                last_dirpath = dirpath
+
+            if rel_dir == os.curdir:
+                rel_path = filename
+            else:
+                rel_path = os.path.join(rel_dir, filename)
+
+            if rel_path in user_claimed:
+                continue
+
+            # User wins over default; first occurrence wins within a level
+            if level_key == "user":
+                user_claimed.add(rel_path)
+            elif rel_path in chosen:
+                continue
+
+            chosen[rel_path] = (
+                os.path.join(dirpath, filename),
+                skill_source,
+                level_key,
+            )
 
     # Now compose: user-level wins, fallback to default-level
     manifest: dict[str, str] = {}
+    # Every file from one source at one level shares a description
+    descriptions: dict[tuple[int, str], str] = {}
+
+    out_root = str(output_dir)
+    placements: list[tuple[str, str]] = []
+    # Relative directories that need creating under output_dir
+    rel_dirs: set[str] = set()
 
-    for rel_path_str, level_files in files_by_path.items():
-        # Determine which file to use (user wins over default)
-        if "user" in level_files:
-            source_file, skill_source = level_files["user"]
-            level_name = "user"
-        elif "default" in level_files:
-            source_file, skill_source = level_files["default"]
-            level_name = "default"
-        else:
-            # Should not happen, but skip if somehow no files
-            continue
-
-        # Copy file to output directory, preserving relative path
-        dest_path = output_dir / rel_path_str
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(source_file, dest_path)
+    for rel_path_str, (source_file, skill_source, level_name) in chosen.items():
+        # Output path preserves the relative path
+        dest_path = os.path.join(out_root, rel_path_str)
+        placements.append((source_file, dest_path))
+        if rel_dir := os.path.dirname(rel_path_str):
+            rel_dirs.add(rel_dir)
 
         # Track source in manifest
-        source_desc = _format_source_description(skill_source, level_name)
-        manifest[str(dest_path)] = source_desc
+        desc_key = (id(skill_source), level_name)
+        source_desc = descriptions.get(desc_key)
+        if source_desc is None:
+            source_desc = _format_source_description(skill_source, level_name)
+            descriptions[desc_key] = source_desc
+        manifest[dest_path] = source_desc
+
+    # Create each destination directory once, serially, so the copies below
+    # never race on mkdir; sorting creates parents before their children
+    for rel_dir in sorted(rel_dirs):
+        os.makedirs(os.path.join(out_root, rel_dir), exist_ok=True)
+
+    # Copies are I/O-bound and release the GIL, so overlap them on a pool
+    if len(placements) < _PARALLEL_COPY_THRESHOLD:
+        for source_file, dest_path in placements:
+            _place_file(source_file, dest_path, use_hardlinks)
+    else:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume results so the first failure is re-raised here
+            list(
+                executor.map(
+                    lambda args: _place_file(*args, use_hardlinks), placements
+                )
+            )
 
     return manifest
 
 
+def _place_file(source_file: str, dest_path: str, use_hardlinks: bool) -> None:
+    """Hard-link or copy a single file into the output directory.
+
+    Args:
+        source_file: Path of the file to place
+        dest_path: Destination path, whose parent must already exist
+        use_hardlinks: Whether to try os.link before copying
+    """
+    # Replace rather than overwrite an existing output: it may be a hard link
+    # from an earlier run, and writing through it would change the source too
+    try:
+        os.unlink(dest_path)
+    except FileNotFoundError:
+        pass
+
+    if use_hardlinks:
+        try:
+            os.link(source_file, dest_path)
+            return
+        except OSError as e:
+            if e.errno not in _LINK_FALLBACK_ERRNOS:
+                raise
+
+    # copy() keeps the mode bits (scripts stay executable) but skips the
+    # timestamp and xattr syscalls of copy2(); contents go through
+    # copyfile(), which uses the kernel's in-place copy on Linux
+    shutil.copy(source_file, dest_path)
+
+
 def _format_source_description(skill_source: SkillSource, level: str) -> str:
     """Format a human-readable description of where a file came from.
 
@@ -1,9 +1,22 @@
 """Markdown file composition with precedence markers."""
 
+import os
 from pathlib import Path
 
 from skill_manager.config.schema import PrecedenceLevel
-from skill_manager.core.skill import SkillSource
+from skill_manager.core.skill import MARKDOWN_SUFFIXES, SkillSource
+from skill_manager.utils.paths import walk_files
+
+# Precedence marker headers, kept as bytes so composition never re-encodes them
+_DEFAULT_PRECEDENCE_MARKER = b"""<!-- PRECEDENCE: default -->
+<!-- The following content is from the default-level skill -->"""
+
+_USER_PRECEDENCE_MARKER = b"""<!-- PRECEDENCE: user (overrides default) -->
+<!-- The following content is from the user-level skill and takes priority -->
+<!-- When conflicts exist, follow the user-level instructions below -->"""
+
+# Separator placed between markers, file contents and sections
+_PART_SEPARATOR = b"\n\n"
 
 
 def compose_markdown_files(
@@ -28,12 +41,13 @@ def compose_markdown_files(
         sources, key=lambda x: 0 if x[1] == PrecedenceLevel.DEFAULT else 1
     )
 
-    # Collect all markdown content with precedence markers
-    composed_content_parts = []
-
+    # Accumulate the composed document as bytes in one growing buffer, with
+    # parts separated by blank lines
+    buffer = bytearray()
+    first_part = True
     for skill_source, precedence_level in sorted_sources:
-        # Get all markdown files from this source
-        markdown_files = skill_source.get_markdown_files()
+        # Get all markdown files from this source, sorted for deterministic output
+        markdown_files = _sorted_markdown_paths(str(skill_source.path))
 
         if not markdown_files:
             # Skip sources without markdown files
@@ -41,39 +55,53 @@ def compose_markdown_files(
 
         # Add precedence marker header
         if precedence_level == PrecedenceLevel.DEFAULT:
-            marker_header = _create_default_precedence_marker()
+            marker_header = _DEFAULT_PRECEDENCE_MARKER
         else:
-            marker_header = _create_user_precedence_marker()
+            marker_header = _USER_PRECEDENCE_MARKER
 
-        composed_content_parts.append(marker_header)
+        if not first_part:
+            buffer.extend(_PART_SEPARATOR)
+        buffer.extend(marker_header)
+        first_part = False
 
         # Concatenate all markdown files from this source
-        for md_file in sorted(markdown_files):  # Sort for deterministic output
-            content = md_file.read_text()
-            # Strip leading/trailing whitespace but preserve internal structure
+        for md_file in markdown_files:
+            # Normalize newlines as text mode would, then strip leading and
+            # trailing whitespace but preserve internal structure
+            with open(md_file, "rb") as f:
+                content = f.read()
+            if b"\r" in content:
+                content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
             content = content.strip()
             if content:
-                composed_content_parts.append(content)
+                buffer.extend(_PART_SEPARATOR)
+                buffer.extend(content)
 
         # Add spacing between precedence sections
-        composed_content_parts.append("")
-
-    # Join all parts with double newlines for readability
-    final_content = "\n\n".join(composed_content_parts)
+        buffer.extend(_PART_SEPARATOR)
 
     # Write to output path
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(final_content)
+    output_path.write_bytes(buffer)
 
 
-def _create_default_precedence_marker() -> str:
-    """Create precedence marker for default-level content."""
-    return """<!-- PRECEDENCE: default -->
-<!-- The following content is from the default-level skill -->""".strip()
+def _sorted_markdown_paths(root: str) -> list[str]:
+    """List markdown files under root as str paths, in Path sort order.
 
+    Walks with walk_files, whose scandir listing already tells files from
+    directories, and filters on the bare name before building any path.
 
-def _create_user_precedence_marker() -> str:
-    """Create precedence marker for user-level content."""
-    return """<!-- PRECEDENCE: user (overrides default) -->
-<!-- The following content is from the user-level skill and takes priority -->
-<!-- When conflicts exist, follow the user-level instructions below -->""".strip()
+    Args:
+        root: Skill directory to search
+
+    Returns:
+        Paths of all markdown files, ordered component by component as
+        sorted() orders Path objects
+    """
+    paths = [
+        os.path.join(dirpath, filename)
+        for dirpath, filename in walk_files(root)
+        if os.path.splitext(filename)[1].lower() in MARKDOWN_SUFFIXES
+    ]
+    paths.sort(key=lambda path: path.split(os.sep))
+    return paths
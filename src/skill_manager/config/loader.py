@@ -1,16 +1,32 @@
 """Configuration loader with merge logic and precedence handling."""
 
+import copy
 import os
+import re
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 from pydantic import ValidationError
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 from skill_manager.config.defaults import DEFAULT_CONFIG
 from skill_manager.config.schema import SkillManagerConfig
 from skill_manager.utils.paths import expand_path
 
+# Parsed YAML keyed by (path, mtime_ns, size), most recently used last
+_YAML_CACHE_MAX_ENTRIES = 32
+_yaml_cache: "OrderedDict[tuple[str, int, int], dict[str, Any]]" = OrderedDict()
+
+# Separator for SKILL_MANAGER_TARGET_DIRS, absorbing surrounding whitespace
+_TARGET_DIRS_SEP = re.compile(r"\s*,\s*")
+
 
 def find_config_files() -> list[Path]:
     """Find configuration files in standard locations.
@@ -23,19 +39,15 @@ def find_config_files() -> list[Path]:
         List of Path objects for existing config files, ordered from lowest
         to highest precedence (so later configs override earlier ones)
     """
-    config_files = []
-
-    # Project config (lowest precedence)
-    project_config = Path.cwd() / "skills.yaml"
-    if project_config.exists():
-        config_files.append(project_config)
-
-    # User config (higher precedence)
-    user_config = expand_path("~/.config/skill-manager/skills.yaml")
-    if user_config.exists():
-        config_files.append(user_config)
+    candidates = (
+        # Project config (lowest precedence)
+        Path.cwd() / "skills.yaml",
+        # User config (higher precedence)
+        expand_path("~/.config/skill-manager/skills.yaml"),
+    )
 
-    return config_files
+    # os.path.isfile is a single stat and skips directories named skills.yaml
+    return [path for path in candidates if os.path.isfile(path)]
 
 
 def load_yaml_file(file_path: Path) -> dict[str, Any]:
@@ -51,9 +63,23 @@ def load_yaml_file(file_path: Path) -> dict[str, Any]:
         yaml.YAMLError: If the file contains invalid YAML
         FileNotFoundError: If the file doesn't exist
     """
-    with open(file_path, "r") as f:
-        content = yaml.safe_load(f)
-        return content if content is not None else {}
+    file_path = Path(file_path)
+    st = file_path.stat()
+    key = (str(file_path), st.st_mtime_ns, st.st_size)
+
+    cached = _yaml_cache.get(key)
+    if cached is None:
+        # libyaml scans a single bytes buffer faster than a text-mode stream
+        content = yaml.load(file_path.read_bytes(), Loader=SafeLoader)
+        cached = content if content is not None else {}
+        _yaml_cache[key] = cached
+        if len(_yaml_cache) > _YAML_CACHE_MAX_ENTRIES:
+            _yaml_cache.popitem(last=False)
+    else:
+        _yaml_cache.move_to_end(key)
+
+    # Callers merge into and mutate the result, so never hand out the cached copy
+    return copy.deepcopy(cached)
 
 
 def merge_configs(configs: list[dict[str, Any]]) -> dict[str, Any]:
@@ -73,35 +99,64 @@ def merge_configs(configs: list[dict[str, Any]]) -> dict[str, Any]:
     if not configs:
         return {}
 
-    result = {}
+    return _merge_and_override(configs, None)
+
+
+def _merge_and_override(
+    configs: list[dict[str, Any]],
+    settings_overrides: Optional[dict[str, Any]],
+) -> dict[str, Any]:
+    """Deep merge configs and apply settings overrides into a single result.
+
+    Args:
+        configs: Configuration dictionaries from lowest to highest precedence
+        settings_overrides: Values written over the merged settings, or None
+                           (or empty) to skip the settings step entirely
+
+    Returns:
+        Newly built configuration dictionary
+    """
+    result: dict[str, Any] = {}
 
     for config in configs:
-        result = _deep_merge(result, config)
+        # Empty files (loaded as {}) contribute nothing, so skip the call
+        if config:
+            _merge_into(result, config)
+
+    if settings_overrides:
+        settings = result.setdefault("settings", {})
+        # Any other non-dict value is left for validation to reject
+        if type(settings) is dict:
+            settings.update(settings_overrides)
 
     return result
 
 
-def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-    """Recursively merge two dictionaries, with override taking precedence.
+def _merge_into(dst: dict[str, Any], src: dict[str, Any]) -> dict[str, Any]:
+    """Recursively merge src into dst in place, with src taking precedence.
+
+    Nested dictionaries from src are copied as they are inserted, so later
+    merges into dst never modify the caller's configs.
 
     Args:
-        base: Base dictionary (lower precedence)
-        override: Override dictionary (higher precedence)
+        dst: Destination dictionary (lower precedence), modified in place
+        src: Source dictionary (higher precedence)
 
     Returns:
-        Merged dictionary
+        The destination dictionary
     """
-    result = base.copy()
-
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+    for key, value in src.items():
+        if type(value) is dict:
+            existing = dst.get(key)
+            if type(existing) is not dict:
+                existing = dst[key] = {}
             # Recursively merge nested dictionaries
-            result[key] = _deep_merge(result[key], value)
+            _merge_into(existing, value)
         else:
             # For non-dict values (including lists), override completely replaces
-            result[key] = value
+            dst[key] = value
 
-    return result
+    return dst
 
 
 def apply_env_overrides(config: dict[str, Any]) -> dict[str, Any]:
@@ -118,27 +173,41 @@ def apply_env_overrides(config: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Configuration dictionary with environment overrides applied
     """
-    result = config.copy()
+    return _merge_and_override([config], _read_env_overrides())
+
+
+def _read_env_overrides() -> dict[str, Any]:
+    """Collect settings overrides from environment variables.
 
-    # Ensure settings exists
-    if "settings" not in result:
-        result["settings"] = {}
+    Returns:
+        Dictionary of settings keys to override, empty if none are set
+    """
+    environ = os.environ
+    overrides: dict[str, Any] = {}
 
     # Apply cache_dir override
-    if cache_dir := os.getenv("SKILL_MANAGER_CACHE_DIR"):
-        result["settings"]["cache_dir"] = cache_dir
+    if cache_dir := environ.get("SKILL_MANAGER_CACHE_DIR"):
+        overrides["cache_dir"] = cache_dir
 
     # Apply default_branch override
-    if default_branch := os.getenv("SKILL_MANAGER_DEFAULT_BRANCH"):
-        result["settings"]["default_branch"] = default_branch
+    if default_branch := environ.get("SKILL_MANAGER_DEFAULT_BRANCH"):
+        overrides["default_branch"] = default_branch
 
     # Apply target_dirs override (comma-separated list)
-    if target_dirs := os.getenv("SKILL_MANAGER_TARGET_DIRS"):
-        result["settings"]["target_dirs"] = [
-            d.strip() for d in target_dirs.split(",") if d.strip()
-        ]
+    if target_dirs := environ.get("SKILL_MANAGER_TARGET_DIRS"):
+        overrides["target_dirs"] = list(_split_target_dirs(target_dirs))
+
+    return overrides
 
-    return result
+
+@lru_cache(maxsize=32)
+def _split_target_dirs(raw: str) -> tuple[str, ...]:
+    """Split a comma-separated target_dirs value, dropping empty entries.
+
+    Keyed on the raw string, so a changed environment variable is always
+    parsed afresh while repeat loads reuse the previous split.
+    """
+    return tuple(d for d in _TARGET_DIRS_SEP.split(raw.strip()) if d)
 
 
 def load_config(config_path: Optional[Path] = None) -> SkillManagerConfig:
@@ -165,11 +234,18 @@ def load_config(config_path: Optional[Path] = None) -> SkillManagerConfig:
         yaml.YAMLError: If a config file contains invalid YAML
         FileNotFoundError: If config_path is provided but doesn't exist
     """
-    # Start with built-in defaults
-    configs_to_merge = [DEFAULT_CONFIG.copy()]
+    config_files = find_config_files()
+    env_overrides = _read_env_overrides()
+
+    # Nothing to layer over the built-in defaults: skip merging and validation
+    if not config_files and config_path is None and not env_overrides:
+        return _validated_defaults().model_copy(deep=True)
+
+    # Start with built-in defaults (merging never mutates its inputs)
+    configs_to_merge = [DEFAULT_CONFIG]
 
     # Add standard config files
-    for config_file in find_config_files():
+    for config_file in config_files:
         try:
             file_config = load_yaml_file(config_file)
             configs_to_merge.append(file_config)
@@ -184,11 +260,8 @@ def load_config(config_path: Optional[Path] = None) -> SkillManagerConfig:
         explicit_config = load_yaml_file(config_path)
         configs_to_merge.append(explicit_config)
 
-    # Merge all configs
-    merged_config = merge_configs(configs_to_merge)
-
-    # Apply environment variable overrides
-    merged_config = apply_env_overrides(merged_config)
+    # Merge all configs and apply environment variable overrides
+    merged_config = _merge_and_override(configs_to_merge, env_overrides)
 
     # Validate and return as Pydantic model
     try:
@@ -199,3 +272,13 @@ def load_config(config_path: Optional[Path] = None) -> SkillManagerConfig:
             title="Configuration validation failed",
             line_errors=e.errors(),
         ) from e
+
+
+@lru_cache(maxsize=1)
+def _validated_defaults() -> SkillManagerConfig:
+    """Validate the built-in defaults once.
+
+    Callers must copy the result before handing it out, since the model's
+    lists and dicts are mutable.
+    """
+    return SkillManagerConfig(**_merge_and_override([DEFAULT_CONFIG], {}))
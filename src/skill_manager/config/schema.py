@@ -4,7 +4,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Annotated, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, field_validator, HttpUrl
 
 
 class PrecedenceLevel(str, Enum):
@@ -23,6 +23,8 @@ class SourceType(str, Enum):
 class SettingsConfig(BaseModel):
     """Global settings for skill manager."""
 
+    model_config = ConfigDict(defer_build=True)
+
     target_dirs: list[str] = Field(
         default=[".claude/skills"],
         description="Target directories where skills will be installed",
@@ -39,6 +41,8 @@ class SettingsConfig(BaseModel):
 class SourceConfig(BaseModel):
     """Configuration for a named skill source."""
 
+    model_config = ConfigDict(defer_build=True)
+
     type: SourceType = Field(description="Type of source (github, etc)")
     repo: str = Field(description="Repository in format 'owner/repo'")
     path: Optional[str] = Field(
@@ -58,7 +62,12 @@ class SourceConfig(BaseModel):
 
 
 class ComposeItemConfig(BaseModel):
-    """A single source in a composed skill."""
+    """A single source in a composed skill.
+
+    Frozen, so validated items can be shared between skills and fixtures.
+    """
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
 
     source: Optional[str] = Field(
         default=None, description="Named source reference (mutually exclusive with path/url)"
@@ -101,6 +110,8 @@ class ComposeItemConfig(BaseModel):
 class SkillConfig(BaseModel):
     """Configuration for a single skill."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(description="Unique skill name")
     description: Optional[str] = Field(
         default=None, description="Human-readable description"
@@ -140,6 +151,8 @@ class SkillConfig(BaseModel):
 class SkillManagerConfig(BaseModel):
     """Root configuration for skill manager."""
 
+    model_config = ConfigDict(defer_build=True)
+
     version: str = Field(description="Config schema version")
     settings: SettingsConfig = Field(default_factory=SettingsConfig)
     sources: dict[str, SourceConfig] = Field(
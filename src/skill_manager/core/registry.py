@@ -1,13 +1,56 @@
 """Skill registry for tracking installed skills."""
 
 import json
+import os
+import tempfile
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from skill_manager.core.skill import Skill
 from skill_manager.utils.paths import ensure_dir
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is used instead
+    orjson = None
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize manifest data as indented UTF-8 JSON with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict:
+    """Parse manifest JSON; both parsers raise json.JSONDecodeError on bad input."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Last timestamp handed out by _now_iso, as (time_ns, ISO string)
+_NOW_ISO_REUSE_NS = 1_000_000
+_last_now_iso: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Return the current UTC time in ISO 8601 format.
+
+    Calls within a millisecond of each other (e.g. a batch of add_skill
+    calls) share one formatted string instead of building a new one.
+    """
+    global _last_now_iso
+    now_ns = time.time_ns()
+    last_ns, last_iso = _last_now_iso
+    if 0 <= now_ns - last_ns < _NOW_ISO_REUSE_NS:
+        return last_iso
+    iso = datetime.fromtimestamp(now_ns / 1e9, timezone.utc).isoformat()
+    _last_now_iso = (now_ns, iso)
+    return iso
+
 
 class SkillRegistry:
     """Manages the skill installation registry and manifest file.
@@ -36,17 +79,8 @@ class SkillRegistry:
         Returns:
             The manifest data as a dictionary
         """
-        if not self.manifest_path.exists():
-            # Return empty manifest structure if file doesn't exist
-            self._manifest_data = {
-                "version": self.MANIFEST_VERSION,
-                "skills": {}
-            }
-            return self._manifest_data
-
         try:
-            with open(self.manifest_path, 'r', encoding='utf-8') as f:
-                self._manifest_data = json.load(f)
+            self._manifest_data = _loads(self.manifest_path.read_bytes())
 
             # Ensure manifest has proper structure
             if "version" not in self._manifest_data:
@@ -54,6 +88,13 @@ class SkillRegistry:
             if "skills" not in self._manifest_data:
                 self._manifest_data["skills"] = {}
 
+            return self._manifest_data
+        except FileNotFoundError:
+            # Return empty manifest structure if file doesn't exist
+            self._manifest_data = {
+                "version": self.MANIFEST_VERSION,
+                "skills": {}
+            }
             return self._manifest_data
         except (json.JSONDecodeError, IOError) as e:
             # If manifest is corrupted, start fresh
@@ -66,15 +107,36 @@ class SkillRegistry:
     def save(self) -> None:
         """Save the manifest to disk.
 
-        Creates the target directory if it doesn't exist.
+        Creates the target directory if it doesn't exist. The manifest is
+        written to a temporary file and renamed into place, so readers never
+        see a partial file; nothing is written if the file on disk already
+        holds the same content.
         """
         # Ensure the target directory exists
         ensure_dir(self.target_dir)
 
-        # Write manifest with pretty formatting
-        with open(self.manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(self._manifest_data, f, indent=2, ensure_ascii=False)
-            f.write('\n')  # Add trailing newline
+        # Serialize with pretty formatting
+        payload = _dumps(self._manifest_data)
+
+        try:
+            unchanged = self.manifest_path.read_bytes() == payload
+        except FileNotFoundError:
+            unchanged = False
+
+        if not unchanged:
+            # A unique temp name keeps concurrent saves from sharing one file
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.target_dir, prefix=self.MANIFEST_FILENAME + "."
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    # mkstemp creates the file owner-only; keep the usual manifest mode
+                    os.fchmod(f.fileno(), 0o644)
+                    f.write(payload)
+                os.replace(tmp_name, self.manifest_path)
+            except OSError:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
 
     def add_skill(self, skill: Skill) -> None:
         """Add or update a skill in the registry.
@@ -84,19 +146,10 @@ class SkillRegistry:
         """
         # Set installed_at timestamp if not already set
         if not skill.installed_at:
-            skill.installed_at = datetime.now(timezone.utc).isoformat()
-
-        # Create skill entry
-        skill_entry = {
-            "name": skill.name,
-            "path": str(skill.path),
-            "description": skill.description,
-            "composed_from": skill.composed_from,
-            "installed_at": skill.installed_at
-        }
+            skill.installed_at = _now_iso()
 
         # Add to manifest
-        self._manifest_data["skills"][skill.name] = skill_entry
+        self._manifest_data["skills"][skill.name] = skill.to_manifest_entry()
 
     def remove_skill(self, name: str) -> None:
         """Remove a skill from the registry.
@@ -126,6 +179,24 @@ class SkillRegistry:
         """
         return list(self._manifest_data["skills"].values())
 
+    def list_skill_fields(self, *fields: str, default: Any = None) -> list[tuple]:
+        """Get selected fields of every installed skill as tuples.
+
+        A projection over the manifest for callers that only need a few
+        columns, e.g. ``list_skill_fields("name", "installed_at")``.
+
+        Args:
+            *fields: Names of the skill entry fields to extract, in order
+            default: Value used for fields missing from an entry
+
+        Returns:
+            One tuple per skill, holding the requested fields in order
+        """
+        return [
+            tuple(entry.get(field, default) for field in fields)
+            for entry in self._manifest_data["skills"].values()
+        ]
+
     def detect_conflicts(self, skill_name: str) -> list[str]:
         """Detect conflicts between a skill and existing installations.
 
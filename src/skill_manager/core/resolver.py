@@ -8,19 +8,23 @@ This module provides functionality to:
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Iterable, Literal, Optional
 from urllib.parse import urlparse
 
 from skill_manager.config.schema import ComposeItemConfig, SourceConfig
-from skill_manager.utils.paths import expand_path
+from skill_manager.utils.paths import absolute_path
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResolvedSource:
     """A resolved source ready for fetching.
 
+    Immutable, so instances can be cached and shared; use
+    dataclasses.replace() to derive a modified copy.
+
     Attributes:
         type: Type of source ("github" or "local")
         owner: GitHub repository owner (for GitHub sources)
@@ -39,6 +43,7 @@ class ResolvedSource:
     local_path: Optional[Path] = None
 
 
+@lru_cache(maxsize=512)
 def parse_github_url(url: str) -> ResolvedSource:
     """Parse a GitHub URL into components.
 
@@ -48,6 +53,8 @@ def parse_github_url(url: str) -> ResolvedSource:
     - github.com/owner/repo (assumes main branch, no path)
     - github.com/owner/repo/tree/branch
 
+    Results are memoized; ResolvedSource is immutable, so sharing is safe.
+
     Args:
         url: GitHub URL to parse
 
@@ -163,18 +170,52 @@ def resolve_compose_item(
     Raises:
         ValueError: If the compose item cannot be resolved
     """
+    return _resolve_item(item, sources, default_branch, {})
+
+
+def resolve_compose_items(
+    items: Iterable[ComposeItemConfig],
+    sources: dict[str, SourceConfig],
+    default_branch: str
+) -> list[ResolvedSource]:
+    """Resolve several compose items, resolving each named source only once.
+
+    Args:
+        items: Compose item configurations to resolve
+        sources: Dictionary of available source configurations
+        default_branch: Default branch to use for sources without a specific branch
+
+    Returns:
+        ResolvedSource for each item, in the same order
+
+    Raises:
+        ValueError: If any compose item cannot be resolved
+    """
+    source_cache: dict[str, ResolvedSource] = {}
+    return [
+        _resolve_item(item, sources, default_branch, source_cache) for item in items
+    ]
+
+
+def _resolve_item(
+    item: ComposeItemConfig,
+    sources: dict[str, SourceConfig],
+    default_branch: str,
+    source_cache: dict[str, ResolvedSource],
+) -> ResolvedSource:
+    """Resolve one compose item, reusing named sources found in source_cache."""
     # Case 1: Named source reference
     if item.source is not None:
         # Resolve the named source
-        resolved = resolve_source(item.source, sources, default_branch)
-
-        # Append the skill name to the path
-        if resolved.path:
-            resolved.path = f"{resolved.path}/{item.skill}"
-        else:
-            resolved.path = item.skill
+        base = source_cache.get(item.source)
+        if base is None:
+            base = resolve_source(item.source, sources, default_branch)
+            source_cache[item.source] = base
 
-        return resolved
+        # Append the skill name to the path, leaving the shared base untouched
+        if base.path:
+            return replace(base, path=f"{base.path}/{item.skill}")
+        return replace(base, path=item.skill)
 
     # Case 2: Direct URL (should be GitHub)
     if item.url is not None:
@@ -184,7 +225,7 @@ def resolve_compose_item(
     if item.path is not None:
         return ResolvedSource(
             type="local",
-            local_path=expand_path(item.path),
+            local_path=absolute_path(item.path),
         )
 
     # Should never reach here due to ComposeItemConfig validation
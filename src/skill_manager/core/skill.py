@@ -1,12 +1,20 @@
 """Core skill models and parsing."""
 
+import copy
+import os
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 
+from skill_manager.utils.paths import walk_files
+
+# Extensions (lowercased) treated as markdown when classifying skill files
+MARKDOWN_SUFFIXES = frozenset({".md"})
+
 
 @dataclass
 class SkillMetadata:
@@ -34,6 +42,40 @@ class SkillMetadata:
         )
 
 
+@lru_cache(maxsize=256)
+def _load_frontmatter(path: str, mtime_ns: int, size: int) -> Optional[dict[str, Any]]:
+    """Load the YAML frontmatter of a SKILL.md file.
+
+    The file's mtime and size are part of the cache key, so an edited file
+    is parsed again rather than served from the cache.
+
+    Args:
+        path: Path to the SKILL.md file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        Frontmatter dictionary, or None if missing, invalid, or lacking a name
+    """
+    content = Path(path).read_text()
+
+    # Match YAML frontmatter: --- at start, content, --- to close
+    pattern = r"^---\s*\n(.*?)\n---\s*\n"
+    match = re.match(pattern, content, re.DOTALL)
+
+    if not match:
+        return None
+
+    frontmatter = match.group(1)
+    try:
+        data = yaml.safe_load(frontmatter)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(data, dict) or "name" not in data:
+        return None
+    return data
+
+
 @dataclass
 class SkillSource:
     """Represents a fetched skill before composition."""
@@ -62,37 +104,45 @@ class SkillSource:
 
     def _parse_skill_md(self, skill_md_path: Path) -> Optional[SkillMetadata]:
         """Parse YAML frontmatter from SKILL.md."""
-        content = skill_md_path.read_text()
-
-        # Match YAML frontmatter: --- at start, content, --- to close
-        pattern = r"^---\s*\n(.*?)\n---\s*\n"
-        match = re.match(pattern, content, re.DOTALL)
-
-        if not match:
-            return None
-
-        frontmatter = match.group(1)
-        try:
-            data = yaml.safe_load(frontmatter)
-            if not isinstance(data, dict):
-                return None
-            if "name" not in data:
-                return None
-            return SkillMetadata.from_yaml(data)
-        except yaml.YAMLError:
+        stat = skill_md_path.stat()
+        data = _load_frontmatter(str(skill_md_path), stat.st_mtime_ns, stat.st_size)
+        if data is None:
             return None
+        # The cached dict is shared, so hand from_yaml a private copy to consume
+        return SkillMetadata.from_yaml(copy.deepcopy(data))
 
     def get_files(self) -> list[Path]:
         """Get all files in the skill directory recursively."""
-        return [f for f in self.path.rglob("*") if f.is_file()]
+        # walk_files classifies entries from the directory listing itself,
+        # avoiding the per-entry stat that rglob + is_file() performs
+        return [
+            Path(dirpath, filename)
+            for dirpath, filename in walk_files(str(self.path))
+        ]
+
+    def get_files_bucketed(self) -> tuple[list[Path], list[Path]]:
+        """Get markdown and non-markdown files with a single directory walk.
+
+        Returns:
+            Tuple of (markdown_files, non_markdown_files)
+        """
+        markdown_files: list[Path] = []
+        other_files: list[Path] = []
+        for dirpath, filename in walk_files(str(self.path)):
+            # Classify on the bare name before building any Path object
+            if os.path.splitext(filename)[1].lower() in MARKDOWN_SUFFIXES:
+                markdown_files.append(Path(dirpath, filename))
+            else:
+                other_files.append(Path(dirpath, filename))
+        return markdown_files, other_files
 
     def get_markdown_files(self) -> list[Path]:
         """Get all markdown files in the skill directory."""
-        return [f for f in self.get_files() if f.suffix.lower() == ".md"]
+        return self.get_files_bucketed()[0]
 
     def get_non_markdown_files(self) -> list[Path]:
         """Get all non-markdown files in the skill directory."""
-        return [f for f in self.get_files() if f.suffix.lower() != ".md"]
+        return self.get_files_bucketed()[1]
 
 
 @dataclass
@@ -117,3 +167,17 @@ class Skill:
             path=target_path,
             description=description,
         )
+
+    def to_manifest_entry(self) -> dict:
+        """Build this skill's entry for the registry manifest.
+
+        Spelled out field by field rather than using dataclasses.asdict,
+        which walks and deep-copies every field on each call.
+        """
+        return {
+            "name": self.name,
+            "path": str(self.path),
+            "description": self.description,
+            "composed_from": self.composed_from,
+            "installed_at": self.installed_at,
+        }
@@ -3,13 +3,18 @@
 import hashlib
 import json
 import shutil
-from datetime import datetime, timedelta, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 from skill_manager.core.skill import SkillSource
 from skill_manager.utils.paths import ensure_dir, expand_path
 
+# Characters that are unsafe in directory names, mapped to "-" in one pass
+_UNSAFE_KEY_CHARS = str.maketrans({c: "-" for c in '/\\:.*?"<>|'})
+
 
 class SkillCache:
     """Cache for downloaded skills with TTL-based expiration.
@@ -51,9 +56,9 @@ class SkillCache:
         hash_digest = hashlib.sha256(identifier.encode()).hexdigest()[:16]
 
         # Create a human-readable prefix
-        safe_owner = owner.replace("/", "-").replace(".", "-")
-        safe_repo = repo.replace("/", "-").replace(".", "-")
-        safe_ref = ref.replace("/", "-").replace(".", "-")
+        safe_owner = owner.translate(_UNSAFE_KEY_CHARS)
+        safe_repo = repo.translate(_UNSAFE_KEY_CHARS)
+        safe_ref = ref.translate(_UNSAFE_KEY_CHARS)
 
         return f"{safe_owner}-{safe_repo}-{safe_ref}-{hash_digest}"
 
@@ -75,7 +80,7 @@ class SkillCache:
         cache_path = self.cache_dir / cache_key
 
         # Check if cache directory exists
-        if not cache_path.exists() or not cache_path.is_dir():
+        if not cache_path.is_dir():
             return None
 
         # Check if expired
@@ -84,23 +89,19 @@ class SkillCache:
             shutil.rmtree(cache_path, ignore_errors=True)
             return None
 
-        # Verify metadata file exists
-        metadata_path = cache_path / self.METADATA_FILE
-        if not metadata_path.exists():
+        metadata = self._read_metadata(cache_path)
+        if metadata is None:
+            # Unreadable metadata - discard the corrupted entry
+            shutil.rmtree(cache_path, ignore_errors=True)
             return None
 
-        # Try to load metadata and verify it matches
-        try:
-            metadata = json.loads(metadata_path.read_text())
-            if (
-                metadata.get("owner") != owner
-                or metadata.get("repo") != repo
-                or metadata.get("path") != path
-                or metadata.get("ref") != ref
-            ):
-                # Metadata mismatch - cache is corrupted
-                return None
-        except (json.JSONDecodeError, OSError):
+        # Verify metadata matches - a mismatch means the cache is corrupted
+        if (
+            metadata.get("owner") != owner
+            or metadata.get("repo") != repo
+            or metadata.get("path") != path
+            or metadata.get("ref") != ref
+        ):
             return None
 
         # Extract skill name from path
@@ -164,37 +165,89 @@ class SkillCache:
         metadata_path = cache_path / self.METADATA_FILE
         metadata_path.write_text(json.dumps(metadata, indent=2))
 
+    def cache_skills_batch(
+        self,
+        items: list[tuple[SkillSource, str, str, str, str]],
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Cache several downloaded skills concurrently.
+
+        Copies are I/O-bound, so a single thread pool is shared across all
+        items. If several items map to the same cache key, the last one wins.
+
+        Args:
+            items: List of (skill, owner, repo, path, ref) tuples, with the
+                same meaning as the arguments to cache_skill
+            max_workers: Maximum number of worker threads (default: executor default)
+
+        Raises:
+            OSError: If caching any of the skills fails
+        """
+        # Entries sharing a key would race on the same directory
+        unique = {
+            self.get_cache_key(owner, repo, path, ref): (skill, owner, repo, path, ref)
+            for skill, owner, repo, path, ref in items
+        }
+        if not unique:
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume results so the first failure is re-raised here
+            list(executor.map(lambda args: self.cache_skill(*args), unique.values()))
+
+    def invalidate(self, owner: str, repo: str, path: str, ref: str) -> bool:
+        """Remove a single cached skill so the next lookup misses.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            path: Path within the repository to the skill
+            ref: Git reference
+
+        Returns:
+            True if a cache entry was removed, False if none existed
+        """
+        cache_path = self.cache_dir / self.get_cache_key(owner, repo, path, ref)
+        if not cache_path.is_dir():
+            return False
+        shutil.rmtree(cache_path, ignore_errors=True)
+        return True
+
     def is_expired(self, cache_path: Path) -> bool:
         """Check if a cached skill has expired.
 
+        Expiry is based on the modification time of the metadata file, which
+        is written last when a skill is cached, so a single stat suffices.
+        The cached_at field in the metadata is kept for human inspection.
+
         Args:
             cache_path: Path to the cached skill directory
 
         Returns:
-            True if expired or invalid, False otherwise
+            True if expired or missing metadata, False otherwise
         """
-        metadata_path = cache_path / self.METADATA_FILE
-        if not metadata_path.exists():
-            return True
-
         try:
-            metadata = json.loads(metadata_path.read_text())
-            cached_at_str = metadata.get("cached_at")
-            if not cached_at_str:
-                return True
+            cached_at = (cache_path / self.METADATA_FILE).stat().st_mtime
+        except OSError:
+            return True
 
-            cached_at = datetime.fromisoformat(cached_at_str)
-            now = datetime.now(timezone.utc)
+        return time.time() - cached_at > self.ttl_seconds
 
-            # Handle naive datetimes by assuming UTC
-            if cached_at.tzinfo is None:
-                cached_at = cached_at.replace(tzinfo=timezone.utc)
+    def _read_metadata(self, cache_path: Path) -> Optional[dict]:
+        """Read the metadata file of a cached skill.
 
-            age = now - cached_at
-            return age > timedelta(seconds=self.ttl_seconds)
+        Args:
+            cache_path: Path to the cached skill directory
 
-        except (json.JSONDecodeError, ValueError, OSError):
-            return True
+        Returns:
+            Parsed metadata dictionary, or None if missing or invalid
+        """
+        metadata_path = cache_path / self.METADATA_FILE
+        try:
+            metadata = json.loads(metadata_path.read_text())
+        except (json.JSONDecodeError, OSError):
+            return None
+        return metadata if isinstance(metadata, dict) else None
 
     def clear_cache(self) -> None:
         """Remove all cached skills.
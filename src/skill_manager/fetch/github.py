@@ -1,8 +1,9 @@
 """GitHub skill fetcher using GitHub Contents API."""
 
 import asyncio
+import contextlib
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import httpx
 
@@ -13,22 +14,64 @@ class GitHubFetcher:
     """Fetcher for downloading skills from GitHub repositories."""
 
     BASE_URL = "https://api.github.com"
+    RAW_BASE_URL = "https://raw.githubusercontent.com"
     MAX_RETRIES = 3
     RETRY_DELAY = 1.0  # seconds
-
-    def __init__(self, token: str | None = None):
+    # Cap on simultaneous file downloads per fetch, to stay clear of rate limits
+    MAX_CONCURRENT_DOWNLOADS = 8
+    # Bytes per chunk when streaming file downloads to disk
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    # Connection pool shared by every request made through this fetcher
+    POOL_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5)
+
+    def __init__(self, token: str | None = None, speculate_skill_md: bool = True):
         """Initialize GitHub fetcher.
 
         Args:
             token: Optional GitHub personal access token for authenticated requests
+            speculate_skill_md: If True, request the skill's SKILL.md while its
+                               directory listing is still in flight
         """
         self.token = token
+        self.speculate_skill_md = speculate_skill_md
         self._headers = {
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28",
         }
         if token:
             self._headers["Authorization"] = f"Bearer {token}"
+        # Created on first use and reused by every fetch until aclose()
+        self._client: Optional[httpx.AsyncClient] = None
+        # Directory listings by (contents URL, ref), with the ETag they came
+        # with, so unchanged listings can be revalidated with a 304
+        self._etag_cache: dict[tuple[str, str], tuple[str, list[dict[str, Any]]]] = {}
+
+    async def __aenter__(self) -> "GitHubFetcher":
+        """Enter an async context that closes the fetcher on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the shared HTTP client."""
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps its connection pool and TLS setup across
+        fetches instead of paying for them on every call.
+
+        Returns:
+            The fetcher's pooled AsyncClient
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=30.0, limits=self.POOL_LIMITS)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def fetch(
         self, owner: str, repo: str, path: str, ref: str, target_dir: Path
@@ -52,9 +95,35 @@ class GitHubFetcher:
         # Create target directory if it doesn't exist
         target_dir.mkdir(parents=True, exist_ok=True)
 
-        # Fetch the contents recursively
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            await self._fetch_directory(client, owner, repo, path, ref, target_dir)
+        # Fetch the contents recursively; the shared pooled client serves
+        # every listing and download, and the semaphore bounds download fan-out
+        client = self._get_client()
+        download_slots = asyncio.Semaphore(self.MAX_CONCURRENT_DOWNLOADS)
+
+        # SKILL.md is almost always present and its raw URL is predictable,
+        # so start downloading it alongside the listing to save a round trip
+        prefetched = None
+        if self.speculate_skill_md:
+            skill_md_url = (
+                f"{self.RAW_BASE_URL}/{owner}/{repo}/{ref}/{path.strip('/')}/SKILL.md"
+            )
+            prefetched = (
+                skill_md_url,
+                asyncio.create_task(
+                    self._speculative_get(client, skill_md_url, download_slots)
+                ),
+            )
+
+        try:
+            await self._fetch_directory(
+                client, owner, repo, path, ref, target_dir, download_slots, prefetched
+            )
+        finally:
+            # Discard the speculative request if the listing never used it
+            if prefetched is not None:
+                prefetched[1].cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await prefetched[1]
 
         # Extract skill name from path (last component)
         skill_name = path.rstrip("/").split("/")[-1]
@@ -78,9 +147,13 @@ class GitHubFetcher:
         path: str,
         ref: str,
         target_dir: Path,
+        download_slots: Optional[asyncio.Semaphore] = None,
+        prefetched: Optional[tuple[str, "asyncio.Task[Optional[bytes]]"]] = None,
     ) -> None:
         """Recursively fetch directory contents from GitHub.
 
+        Files and subdirectories of a listing are fetched concurrently.
+
         Args:
             client: HTTP client for making requests
             owner: Repository owner
@@ -88,6 +161,9 @@ class GitHubFetcher:
             path: Path within the repository
             ref: Git reference
             target_dir: Local directory to save contents
+            download_slots: Optional semaphore limiting concurrent downloads
+            prefetched: Optional (download_url, task) for a file requested
+                        speculatively; used if the listing names that URL
         """
         # Get directory contents
         contents = await self._get_contents(client, owner, repo, path, ref)
@@ -103,17 +179,28 @@ class GitHubFetcher:
                 continue
 
             if item_type == "file":
-                # Download file
-                task = self._download_file(
-                    client, item, target_dir / item_name
-                )
+                download_url = item.get("download_url")
+                if prefetched is not None and download_url == prefetched[0]:
+                    # Reuse the speculative download of this file
+                    task = self._write_prefetched(
+                        client,
+                        item,
+                        target_dir / item_name,
+                        download_slots,
+                        prefetched[1],
+                    )
+                else:
+                    # Download file
+                    task = self._download_file(
+                        client, item, target_dir / item_name, download_slots
+                    )
                 tasks.append(task)
             elif item_type == "dir":
                 # Recursively fetch subdirectory
                 subdir = target_dir / item_name
                 subdir.mkdir(parents=True, exist_ok=True)
                 task = self._fetch_directory(
-                    client, owner, repo, item_path, ref, subdir
+                    client, owner, repo, item_path, ref, subdir, download_slots
                 )
                 tasks.append(task)
 
@@ -131,6 +218,9 @@ class GitHubFetcher:
     ) -> list[dict[str, Any]]:
         """Get contents of a directory from GitHub API.
 
+        A listing seen before is requested with If-None-Match, and a 304
+        response reuses the cached copy instead of transferring it again.
+
         Args:
             client: HTTP client
             owner: Repository owner
@@ -148,11 +238,19 @@ class GitHubFetcher:
         url = f"{self.BASE_URL}/repos/{owner}/{repo}/contents/{path}"
         params = {"ref": ref}
 
+        cache_key = (url, ref)
+        cached = self._etag_cache.get(cache_key)
+        headers = self._headers
+        if cached is not None:
+            headers = {**self._headers, "If-None-Match": cached[0]}
+
         for attempt in range(self.MAX_RETRIES):
             try:
                 response = await client.get(
-                    url, headers=self._headers, params=params, follow_redirects=True
+                    url, headers=headers, params=params, follow_redirects=True
                 )
+                if response.status_code == 304 and cached is not None:
+                    return cached[1]
                 response.raise_for_status()
 
                 data = response.json()
@@ -160,6 +258,8 @@ class GitHubFetcher:
                     raise ValueError(
                         f"Expected directory at {path}, got file or invalid response"
                     )
+                if etag := response.headers.get("ETag"):
+                    self._etag_cache[cache_key] = (etag, data)
                 return data
 
             except httpx.HTTPStatusError as e:
@@ -180,7 +280,11 @@ class GitHubFetcher:
         raise httpx.HTTPError(f"Failed to fetch contents after {self.MAX_RETRIES} attempts")
 
     async def _download_file(
-        self, client: httpx.AsyncClient, item: dict[str, Any], target_path: Path
+        self,
+        client: httpx.AsyncClient,
+        item: dict[str, Any],
+        target_path: Path,
+        download_slots: Optional[asyncio.Semaphore] = None,
     ) -> None:
         """Download a file from GitHub.
 
@@ -188,6 +292,7 @@ class GitHubFetcher:
             client: HTTP client
             item: Content item from GitHub API containing download_url
             target_path: Local path to save the file
+            download_slots: Optional semaphore held while a request is in flight
 
         Raises:
             ValueError: If download_url is missing
@@ -199,13 +304,14 @@ class GitHubFetcher:
 
         for attempt in range(self.MAX_RETRIES):
             try:
-                response = await client.get(
-                    download_url, follow_redirects=True
-                )
-                response.raise_for_status()
-
-                # Write file content
-                target_path.write_bytes(response.content)
+                if download_slots is None:
+                    await self._stream_to_file(client, download_url, target_path)
+                else:
+                    # Hold a slot only for the transfer, not for retry back-off
+                    async with download_slots:
+                        await self._stream_to_file(
+                            client, download_url, target_path
+                        )
                 return
 
             except httpx.HTTPError as e:
@@ -217,3 +323,73 @@ class GitHubFetcher:
         raise httpx.HTTPError(
             f"Failed to download file {target_path.name} after {self.MAX_RETRIES} attempts"
         )
+
+    async def _speculative_get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        download_slots: Optional[asyncio.Semaphore] = None,
+    ) -> Optional[bytes]:
+        """Fetch a file that may not exist, without raising.
+
+        Args:
+            client: HTTP client
+            url: URL to download
+            download_slots: Optional semaphore held while the request is in flight
+
+        Returns:
+            The response body, or None if the request failed for any reason
+        """
+        try:
+            async with download_slots or contextlib.nullcontext():
+                response = await client.get(url, follow_redirects=True)
+            response.raise_for_status()
+            return response.content
+        except Exception:
+            # Speculation is best effort; the regular download path retries
+            return None
+
+    async def _write_prefetched(
+        self,
+        client: httpx.AsyncClient,
+        item: dict[str, Any],
+        target_path: Path,
+        download_slots: Optional[asyncio.Semaphore],
+        prefetched: "asyncio.Task[Optional[bytes]]",
+    ) -> None:
+        """Write a speculatively fetched file, falling back to a normal download.
+
+        Args:
+            client: HTTP client
+            item: Content item from GitHub API containing download_url
+            target_path: Local path to save the file
+            download_slots: Optional semaphore limiting concurrent downloads
+            prefetched: Task resolving to the file body, or None on failure
+        """
+        content = await prefetched
+        if content is None:
+            await self._download_file(client, item, target_path, download_slots)
+            return
+        target_path.write_bytes(content)
+
+    async def _stream_to_file(
+        self, client: httpx.AsyncClient, url: str, target_path: Path
+    ) -> None:
+        """Stream a response body to disk in chunks.
+
+        Only one chunk is held in memory at a time, rather than the whole
+        file as with response.content.
+
+        Args:
+            client: HTTP client
+            url: URL to download
+            target_path: Local path to save the file (truncated on retry)
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        async with client.stream("GET", url, follow_redirects=True) as response:
+            response.raise_for_status()
+            with open(target_path, "wb") as f:
+                async for chunk in response.aiter_bytes(self.DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
@@ -1,5 +1,7 @@
 """Path utilities for expanding and normalizing filesystem paths."""
 
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 
@@ -15,6 +17,21 @@ def expand_path(path: str) -> Path:
     return Path(path).expanduser().resolve()
 
 
+def absolute_path(path: str) -> Path:
+    """Expand ~ and make a path absolute without touching the filesystem.
+
+    Unlike expand_path, symlinks are not resolved and ".." is collapsed
+    lexically, so no stat calls are made.
+
+    Args:
+        path: Path string that may contain ~ or be relative
+
+    Returns:
+        Absolute, normalized Path object
+    """
+    return Path(os.path.abspath(os.path.expanduser(path)))
+
+
 def ensure_dir(path: Path) -> Path:
     """Ensure a directory exists, creating it if necessary.
 
@@ -26,3 +43,37 @@ def ensure_dir(path: Path) -> Path:
     """
     path.mkdir(parents=True, exist_ok=True)
     return path
+
+
+def walk_files(root: str) -> Iterator[tuple[str, str]]:
+    """Walk a directory tree and yield every regular file in it.
+
+    Behaves like ``rglob("*")`` filtered by ``is_file()``: dangling symlinks,
+    FIFOs and sockets are skipped, and symlinked directories are not
+    descended into. Entries are classified from the scandir listing, so only
+    symlinks cost an extra stat.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        (dirpath, filename) pairs, visiting directories top-down as os.walk does
+    """
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        filenames: list[str] = []
+        subdirs: list[str] = []
+        try:
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        filenames.append(entry.name)
+        except OSError:
+            continue
+
+        for filename in filenames:
+            yield dirpath, filename
+        stack.extend(reversed(subdirs))
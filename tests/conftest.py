@@ -1,10 +1,95 @@
 """Shared pytest fixtures for skill manager tests."""
 
+import io
+import os
+import sys
+import tarfile
 import tempfile
 from pathlib import Path
+from typing import Optional
 
 import pytest
 
+# RAM-backed filesystem used for test temp dirs when available
+TMPFS_ROOT = "/dev/shm"
+
+# tempfile.tempdir as it was before pytest_configure pointed it at tmpfs
+_saved_tempdir_key = pytest.StashKey[Optional[str]]()
+
+
+def _build_tar(files: dict[str, str]) -> bytes:
+    """Pack files into an uncompressed tar archive held in memory."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name, content in files.items():
+            data = content.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def pytest_configure(config):
+    """Place pytest's temporary directories on tmpfs when available.
+
+    Tests here are dominated by small file writes, so keeping them in RAM
+    avoids disk I/O. Pointing tempfile at tmpfs (rather than forcing
+    --basetemp) keeps pytest's per-user numbered directories and retention.
+    An explicit --basetemp always wins.
+    """
+    if config.option.basetemp is not None:
+        return
+    if os.path.isdir(TMPFS_ROOT) and os.access(TMPFS_ROOT, os.W_OK):
+        config.stash[_saved_tempdir_key] = tempfile.tempdir
+        tempfile.tempdir = TMPFS_ROOT
+
+
+def pytest_unconfigure(config):
+    """Restore the tempfile directory replaced in pytest_configure."""
+    if _saved_tempdir_key in config.stash:
+        tempfile.tempdir = config.stash[_saved_tempdir_key]
+
+
+@pytest.fixture(scope="module")
+def anyio_backend():
+    """Run anyio tests on asyncio, using uvloop's event loop when available.
+
+    The mocked HTTP tests do little besides hop through the event loop, so
+    uvloop's cheaper dispatch shortens them. Falls back to the stock loop on
+    Windows or when uvloop is not installed. Module-scoped to match the
+    anyio plugin's default, which module-scoped async fixtures rely on.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return ("asyncio", {"loop_factory": uvloop.new_event_loop})
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def write_tree():
+    """Provide a function that writes a {relative path: content} tree to a directory.
+
+    Each distinct tree is packed into an in-memory tar archive the first
+    time it is written and extracted on later calls, instead of writing the
+    files one by one. The function takes (files, dest) and returns dest.
+    """
+    archives: dict[tuple[tuple[str, str], ...], bytes] = {}
+
+    def write(files: dict[str, str], dest: Path) -> Path:
+        key = tuple(files.items())
+        archive = archives.get(key)
+        if archive is None:
+            archive = archives[key] = _build_tar(files)
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(dest, filter="data")
+        return dest
+
+    return write
+
 
 @pytest.fixture
 def temp_dir(tmp_path):
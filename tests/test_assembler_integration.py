@@ -17,17 +17,9 @@ from skill_manager.config.schema import (
 )
 
 
-@pytest.fixture
-def skill_library(tmp_path):
-    """Create a mock skill library with multiple skills."""
-    library = tmp_path / "skill-library"
-    library.mkdir()
-
-    # Create base SQL skill
-    sql_base = library / "sql-base"
-    sql_base.mkdir()
-    (sql_base / "SKILL.md").write_text(
-        """---
+# Mock skill library contents, keyed by path relative to the library root
+_SKILL_LIBRARY_FILES = {
+    "sql-base/SKILL.md": """---
 name: sql-base
 description: Basic SQL query assistance
 version: 1.0.0
@@ -41,24 +33,16 @@ Help with basic SQL queries.
 - SELECT statements
 - WHERE clauses
 - JOIN operations
-"""
-    )
-    (sql_base / "examples.sql").write_text(
-        """-- Basic SELECT
+""",
+    "sql-base/examples.sql": """-- Basic SELECT
 SELECT * FROM users;
 
 -- JOIN example
 SELECT u.name, o.total
 FROM users u
 JOIN orders o ON u.id = o.user_id;
-"""
-    )
-
-    # Create advanced SQL skill
-    sql_advanced = library / "sql-advanced"
-    sql_advanced.mkdir()
-    (sql_advanced / "SKILL.md").write_text(
-        """---
+""",
+    "sql-advanced/SKILL.md": """---
 name: sql-advanced
 description: Advanced SQL techniques
 version: 1.0.0
@@ -73,10 +57,8 @@ Advanced SQL optimization and techniques.
 - Index usage
 - Complex subqueries
 - Window functions
-"""
-    )
-    (sql_advanced / "optimization.sql").write_text(
-        """-- Use indexes
+""",
+    "sql-advanced/optimization.sql": """-- Use indexes
 CREATE INDEX idx_user_email ON users(email);
 
 -- Window function example
@@ -85,14 +67,8 @@ SELECT
     salary,
     AVG(salary) OVER (PARTITION BY department) as dept_avg
 FROM employees;
-"""
-    )
-
-    # Create company-specific SQL customization
-    sql_company = library / "sql-company"
-    sql_company.mkdir()
-    (sql_company / "SKILL.md").write_text(
-        """---
+""",
+    "sql-company/SKILL.md": """---
 name: sql-company
 description: Company-specific SQL guidelines
 version: 1.0.0
@@ -106,20 +82,22 @@ Always follow our company standards:
 - Always use snake_case for table names
 - Always add created_at and updated_at columns
 - Always use UTC for timestamps
-"""
-    )
-    (sql_company / "schema_template.sql").write_text(
-        """-- Company standard table template
+""",
+    "sql-company/schema_template.sql": """-- Company standard table template
 CREATE TABLE example_table (
     id SERIAL PRIMARY KEY,
     name VARCHAR(255) NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
-"""
-    )
+""",
+}
 
-    return library
+
+@pytest.fixture
+def skill_library(tmp_path, write_tree):
+    """Create a mock skill library with multiple skills."""
+    return write_tree(_SKILL_LIBRARY_FILES, tmp_path / "skill-library")
 
 
 @pytest.mark.anyio
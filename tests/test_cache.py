@@ -1,6 +1,8 @@
 """Tests for skill cache functionality."""
 
 import json
+import os
+import shutil
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -11,6 +13,15 @@ from skill_manager.core.skill import SkillSource
 from skill_manager.fetch.cache import SkillCache
 
 
+def _write_file(path: Path, content: str) -> None:
+    """Write text through a raw file descriptor, skipping TextIOWrapper setup."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content.encode())
+    finally:
+        os.close(fd)
+
+
 @pytest.fixture
 def cache_dir(tmp_path):
     """Provide a temporary cache directory."""
@@ -25,7 +36,8 @@ def skill_dir(tmp_path):
 
     # Create SKILL.md
     skill_md = skill_path / "SKILL.md"
-    skill_md.write_text(
+    _write_file(
+        skill_md,
         """---
 name: sample-skill
 description: A sample skill
@@ -39,13 +51,13 @@ This is a sample skill for testing.
     )
 
     # Create other files
-    (skill_path / "helper.py").write_text("# Helper code")
-    (skill_path / "README.md").write_text("# README")
+    _write_file(skill_path / "helper.py", "# Helper code")
+    _write_file(skill_path / "README.md", "# README")
 
     # Create subdirectory
     subdir = skill_path / "utils"
     subdir.mkdir()
-    (subdir / "tools.py").write_text("# Tools")
+    _write_file(subdir / "tools.py", "# Tools")
 
     return skill_path
 
@@ -191,17 +203,36 @@ class TestSkillCache:
 
         assert cache.is_expired(cache_path)
 
-    def test_is_expired_invalid_metadata(self, cache_dir):
-        """Test that cache with invalid metadata is considered expired."""
+    def test_invalid_metadata_discarded_on_get(self, cache_dir, skill_source):
+        """Test that a cache entry with invalid metadata is discarded."""
         cache = SkillCache(cache_dir)
 
-        # Create a cache directory with invalid metadata
-        cache_path = cache_dir / "test-cache"
-        cache_path.mkdir(parents=True)
+        cache.cache_skill(skill_source, "test", "repo", "skills/sample-skill", "main")
+
+        cache_key = cache.get_cache_key("test", "repo", "skills/sample-skill", "main")
+        cache_path = cache_dir / cache_key
 
         metadata_path = cache_path / SkillCache.METADATA_FILE
         metadata_path.write_text("invalid json")
 
+        cached = cache.get_cached_skill("test", "repo", "skills/sample-skill", "main")
+        assert cached is None
+        assert not cache_path.exists()
+
+    def test_is_expired_uses_metadata_mtime(self, cache_dir, skill_source):
+        """Test that expiry follows the metadata file's modification time."""
+        cache = SkillCache(cache_dir, ttl_seconds=3600)
+
+        cache.cache_skill(skill_source, "test", "repo", "skills/sample-skill", "main")
+
+        cache_key = cache.get_cache_key("test", "repo", "skills/sample-skill", "main")
+        cache_path = cache_dir / cache_key
+        assert not cache.is_expired(cache_path)
+
+        # Backdate the metadata file beyond the TTL
+        old = time.time() - 7200
+        os.utime(cache_path / SkillCache.METADATA_FILE, (old, old))
+
         assert cache.is_expired(cache_path)
 
     def test_expired_cache_cleaned_on_get(self, cache_dir, skill_source):
@@ -255,9 +286,13 @@ class TestSkillCache:
         cache = SkillCache(cache_dir)
 
         # Cache multiple skills
-        cache.cache_skill(skill_source, "test", "repo", "skills/sample-skill", "main")
-        cache.cache_skill(skill_source, "test", "repo", "skills/sample-skill", "dev")
-        cache.cache_skill(skill_source, "test", "other", "skills/sample-skill", "main")
+        cache.cache_skills_batch(
+            [
+                (skill_source, "test", "repo", "skills/sample-skill", "main"),
+                (skill_source, "test", "repo", "skills/sample-skill", "dev"),
+                (skill_source, "test", "other", "skills/sample-skill", "main"),
+            ]
+        )
 
         # Verify they exist
         assert len(list(cache_dir.iterdir())) == 3
@@ -268,6 +303,47 @@ class TestSkillCache:
         # Verify all removed
         assert len(list(cache_dir.iterdir())) == 0
 
+    def test_cache_skills_batch(self, cache_dir, skill_source):
+        """Test caching several skills in one batch."""
+        cache = SkillCache(cache_dir)
+
+        cache.cache_skills_batch(
+            [
+                (skill_source, "test", "repo", "skills/sample-skill", "main"),
+                (skill_source, "test", "repo", "skills/sample-skill", "dev"),
+                # Duplicate key is only cached once
+                (skill_source, "test", "repo", "skills/sample-skill", "dev"),
+            ]
+        )
+
+        assert len(list(cache_dir.iterdir())) == 2
+        for ref in ("main", "dev"):
+            cached = cache.get_cached_skill("test", "repo", "skills/sample-skill", ref)
+            assert cached is not None
+            assert (cached.path / "utils" / "tools.py").exists()
+
+    def test_cache_skills_batch_empty(self, cache_dir):
+        """Test that an empty batch is a no-op."""
+        cache = SkillCache(cache_dir)
+        cache.cache_skills_batch([])
+        assert list(cache_dir.iterdir()) == []
+
+    def test_invalidate(self, cache_dir, skill_source):
+        """Test invalidating a single cached skill."""
+        cache = SkillCache(cache_dir)
+
+        cache.cache_skill(skill_source, "test", "repo", "skills/sample-skill", "main")
+        cache.cache_skill(skill_source, "test", "repo", "skills/sample-skill", "dev")
+
+        assert cache.invalidate("test", "repo", "skills/sample-skill", "main")
+        assert cache.get_cached_skill("test", "repo", "skills/sample-skill", "main") is None
+
+        # Other entries are untouched
+        assert cache.get_cached_skill("test", "repo", "skills/sample-skill", "dev") is not None
+
+        # Invalidating a missing entry is a no-op
+        assert not cache.invalidate("test", "repo", "skills/sample-skill", "main")
+
     def test_clear_empty_cache(self, cache_dir):
         """Test clearing an empty cache doesn't raise errors."""
         cache = SkillCache(cache_dir)
@@ -317,10 +393,9 @@ class TestSkillCache:
         cache_key = cache.get_cache_key("test", "repo", "skills/invalid-skill", "main")
         cache_path = cache_dir / cache_key
 
-        # Remove all files to make it invalid
-        for item in cache_path.iterdir():
-            if item.is_file():
-                item.unlink()
+        # Wipe the cache entry to make it invalid
+        shutil.rmtree(cache_path, ignore_errors=True)
+        cache_path.mkdir()
 
         # Should return None due to validation failure
         cached = cache.get_cached_skill("test", "repo", "skills/invalid-skill", "main")
@@ -340,8 +415,18 @@ class TestSkillCache:
         assert "\\" not in key
         assert ":" not in key
 
-    def test_is_expired_with_naive_datetime(self, cache_dir, skill_source):
-        """Test expiration handling with naive datetime (no timezone)."""
+    def test_cache_key_replaces_reserved_characters(self, cache_dir):
+        """Test that filesystem-reserved characters are replaced in cache keys."""
+        cache = SkillCache(cache_dir)
+
+        key = cache.get_cache_key("owner", "repo", "skills/x", 'a\\b:c*d?e"f<g>h|i')
+
+        for char in '\\:*?"<>|':
+            assert char not in key
+        assert "a-b-c-d-e-f-g-h-i" in key
+
+    def test_is_expired_ignores_cached_at_field(self, cache_dir, skill_source):
+        """Test that a stale cached_at field does not expire a fresh entry."""
         cache = SkillCache(cache_dir, ttl_seconds=3600)
 
         cache.cache_skill(skill_source, "test", "repo", "skills/sample-skill", "main")
@@ -349,14 +434,10 @@ class TestSkillCache:
         cache_key = cache.get_cache_key("test", "repo", "skills/sample-skill", "main")
         cache_path = cache_dir / cache_key
 
-        # Modify metadata to have naive datetime
+        # Rewrite cached_at far in the past; the rewrite also refreshes the mtime
         metadata_path = cache_path / SkillCache.METADATA_FILE
         metadata = json.loads(metadata_path.read_text())
-
-        # Create naive datetime (no timezone) - use UTC time to ensure it's recent
-        naive_time = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
-        metadata["cached_at"] = naive_time
+        metadata["cached_at"] = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
         metadata_path.write_text(json.dumps(metadata))
 
-        # Should handle gracefully and treat as UTC
         assert not cache.is_expired(cache_path)
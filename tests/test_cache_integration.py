@@ -1,5 +1,6 @@
 """Integration tests for SkillCache with SkillSource."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -14,16 +15,9 @@ def cache_dir(tmp_path):
     return tmp_path / "cache"
 
 
-@pytest.fixture
-def skill_dir(tmp_path):
-    """Create a sample skill directory."""
-    skill_path = tmp_path / "test-skill"
-    skill_path.mkdir()
-
-    # Create SKILL.md with frontmatter
-    skill_md = skill_path / "SKILL.md"
-    skill_md.write_text(
-        """---
+# Sample skill contents, keyed by path relative to the skill root
+_SKILL_FILES = {
+    "SKILL.md": """---
 name: test-skill
 description: A test skill
 version: 1.0.0
@@ -37,37 +31,55 @@ This is a test skill for integration testing.
 ## Usage
 
 Use this skill to test caching functionality.
-"""
-    )
-
-    # Create additional files
-    (skill_path / "helper.py").write_text(
-        """def helper_function():
+""",
+    "helper.py": """def helper_function():
     return "Hello from helper"
-"""
-    )
+""",
+    "README.md": "# Test Skill README",
+    "utils/tools.py": "# Utility tools",
+}
+
+
+def _snapshot(root: Path) -> dict[str, bytes]:
+    """Collect every file under root in one walk, keyed by POSIX relative path."""
+    snapshot = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            file_path = os.path.join(dirpath, filename)
+            rel_path = os.path.relpath(file_path, root).replace(os.sep, "/")
+            with open(file_path, "rb") as f:
+                snapshot[rel_path] = f.read()
+    return snapshot
 
-    (skill_path / "README.md").write_text("# Test Skill README")
 
-    # Create nested structure
-    utils_dir = skill_path / "utils"
-    utils_dir.mkdir()
-    (utils_dir / "tools.py").write_text("# Utility tools")
+@pytest.fixture(scope="session")
+def skill_dir_template(tmp_path_factory, write_tree):
+    """Create a sample skill directory once per session.
 
-    return skill_path
+    Shared across tests, so it must be treated as read-only; tests that
+    modify the skill should use ``skill_dir`` instead.
+    """
+    template_root = tmp_path_factory.mktemp("skill_template")
+    return write_tree(_SKILL_FILES, template_root / "test-skill")
+
+
+@pytest.fixture
+def skill_dir(tmp_path, write_tree):
+    """Provide a private, writable sample skill directory."""
+    return write_tree(_SKILL_FILES, tmp_path / "test-skill")
 
 
 class TestCacheIntegration:
     """Integration tests for cache with real SkillSource objects."""
 
-    def test_cache_preserves_skill_metadata(self, cache_dir, skill_dir):
+    def test_cache_preserves_skill_metadata(self, cache_dir, skill_dir_template):
         """Test that caching preserves skill metadata from SKILL.md."""
         cache = SkillCache(cache_dir)
 
         # Create a SkillSource (this parses SKILL.md)
         original = SkillSource(
             name="test-skill",
-            path=skill_dir,
+            path=skill_dir_template,
             source_url="https://github.com/test/repo/tree/main/skills/test-skill",
             source_ref="main",
         )
@@ -93,13 +105,13 @@ class TestCacheIntegration:
         assert cached.metadata.version == "1.0.0"
         assert cached.metadata.author == "Test Author"
 
-    def test_cache_preserves_file_structure(self, cache_dir, skill_dir):
+    def test_cache_preserves_file_structure(self, cache_dir, skill_dir_template):
         """Test that caching preserves the complete file structure."""
         cache = SkillCache(cache_dir)
 
         original = SkillSource(
             name="test-skill",
-            path=skill_dir,
+            path=skill_dir_template,
             source_url="https://github.com/test/repo/tree/main/skills/test-skill",
             source_ref="main",
         )
@@ -112,24 +124,18 @@ class TestCacheIntegration:
 
         assert cached is not None
 
-        # Verify all files exist
-        assert (cached.path / "SKILL.md").exists()
-        assert (cached.path / "helper.py").exists()
-        assert (cached.path / "README.md").exists()
-        assert (cached.path / "utils" / "tools.py").exists()
+        # Verify all files exist with identical contents
+        snapshot = _snapshot(cached.path)
+        for rel_path, content in _SKILL_FILES.items():
+            assert snapshot[rel_path] == content.encode()
 
-        # Verify file contents
-        assert "A test skill" in (cached.path / "SKILL.md").read_text()
-        assert "helper_function" in (cached.path / "helper.py").read_text()
-        assert "Utility tools" in (cached.path / "utils" / "tools.py").read_text()
-
-    def test_cache_with_skill_source_methods(self, cache_dir, skill_dir):
+    def test_cache_with_skill_source_methods(self, cache_dir, skill_dir_template):
         """Test that cached SkillSource supports all methods."""
         cache = SkillCache(cache_dir)
 
         original = SkillSource(
             name="test-skill",
-            path=skill_dir,
+            path=skill_dir_template,
             source_url="https://github.com/test/repo/tree/main/skills/test-skill",
             source_ref="main",
         )
@@ -164,6 +170,27 @@ class TestCacheIntegration:
         assert "tools.py" in non_md_names
         assert "SKILL.md" not in non_md_names
 
+        # Test get_files_bucketed() matches the individual methods
+        bucketed_md, bucketed_non_md = cached.get_files_bucketed()
+        assert set(bucketed_md) == set(md_files)
+        assert set(bucketed_non_md) == set(non_md_files)
+
+    def test_skill_files_skip_non_regular_entries(self, skill_dir):
+        """Test that dangling symlinks and FIFOs are not listed as skill files."""
+        (skill_dir / "dangling.txt").symlink_to(skill_dir / "missing.txt")
+        (skill_dir / "linked.py").symlink_to(skill_dir / "helper.py")
+        os.mkfifo(skill_dir / "pipe")
+
+        source = SkillSource(name="test-skill", path=skill_dir)
+
+        names = {f.name for f in source.get_files()}
+        assert "dangling.txt" not in names
+        assert "pipe" not in names
+        assert "linked.py" in names
+
+        _, non_md_files = source.get_files_bucketed()
+        assert {f.name for f in non_md_files} == {"helper.py", "linked.py", "tools.py"}
+
     def test_cache_workflow_with_force_refresh(self, cache_dir, skill_dir):
         """Test a typical cache workflow with force refresh."""
         cache = SkillCache(cache_dir, ttl_seconds=3600)
@@ -192,16 +219,10 @@ class TestCacheIntegration:
         cached = cache.get_cached_skill("test", "repo", "skills/test-skill", "main")
         assert not (cached.path / "new_file.py").exists()
 
-        # Force refresh by re-caching
-        updated_original = SkillSource(
-            name="test-skill",
-            path=skill_dir,
-            source_url="https://github.com/test/repo/tree/main/skills/test-skill",
-            source_ref="main",
-        )
-        cache.cache_skill(
-            updated_original, "test", "repo", "skills/test-skill", "main"
-        )
+        # Force refresh: invalidate, then re-cache the same source
+        assert cache.invalidate("test", "repo", "skills/test-skill", "main")
+        assert cache.get_cached_skill("test", "repo", "skills/test-skill", "main") is None
+        cache.cache_skill(original, "test", "repo", "skills/test-skill", "main")
 
         # Now new file should be present
         cached = cache.get_cached_skill("test", "repo", "skills/test-skill", "main")
@@ -245,3 +266,18 @@ class TestCacheIntegration:
 
         # Dev has dev feature
         assert (dev_cached.path / "dev_feature.py").exists()
+
+    def test_metadata_reparsed_after_skill_md_edit(self, skill_dir):
+        """Test that editing SKILL.md is picked up by new SkillSource objects."""
+        first = SkillSource(name="test-skill", path=skill_dir)
+        assert first.metadata.name == "test-skill"
+
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: renamed-skill\ndescription: Edited\n---\n\n# Renamed\n"
+        )
+
+        second = SkillSource(name="test-skill", path=skill_dir)
+        assert second.metadata.name == "renamed-skill"
+        assert second.metadata.description == "Edited"
+        # Earlier objects keep their own metadata
+        assert first.metadata.name == "test-skill"
@@ -1,6 +1,7 @@
 """Integration tests for CLI commands."""
 
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -10,26 +11,100 @@ from typer.testing import CliRunner
 from skill_manager.cli import app
 from skill_manager.core.registry import SkillRegistry
 
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
 runner = CliRunner()
 
+# skills.yaml with a single local-path skill; values are JSON-quoted (valid YAML)
+_LOCAL_SKILL_CONFIG = """\
+version: "1.0"
+settings:
+  target_dirs: [{target_dir}]
+  cache_dir: {cache_dir}
+skills:
+  - name: {name}
+    path: {skill_path}
+"""
+
+
+def _local_skill_config(
+    target_dir: Path, cache_dir: Path, skill_path: Path, name: str = "test-skill"
+) -> str:
+    """Render a config with one local skill without going through yaml.dump."""
+    return _LOCAL_SKILL_CONFIG.format(
+        target_dir=json.dumps(str(target_dir)),
+        cache_dir=json.dumps(str(cache_dir)),
+        name=json.dumps(name),
+        skill_path=json.dumps(str(skill_path)),
+    )
+
+
+def _load_yaml(path: Path) -> dict:
+    """Parse a YAML file with the C loader when available."""
+    return yaml.load(path.read_text(), Loader=_SafeLoader)
+
+
+def _dump_yaml(data: dict) -> str:
+    """Serialize data to YAML with the C dumper when available."""
+    return yaml.dump(data, Dumper=_SafeDumper)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_cli():
+    """Pay one-time CLI start-up costs (command tree, console setup) once."""
+    runner.invoke(app, ["--help"])
+
+
+@pytest.fixture(scope="module")
+def synced_env(tmp_path_factory):
+    """Sync a single local skill once and share the result across tests.
+
+    Tests using this fixture must only read from it. Commands should be
+    pointed at it explicitly via --config.
+    """
+    root = tmp_path_factory.mktemp("synced")
+    work_dir = root / "work"
+    work_dir.mkdir()
+    home_dir = root / "home"
+    home_dir.mkdir()
+    skill_dir = root / "test-skill"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text(
+        "---\nname: test-skill\ndescription: A synced skill\n---\n\n# Test Skill\n"
+    )
+
+    target_dir = work_dir / ".claude" / "skills"
+    config_file = work_dir / "skills.yaml"
+    config_file.write_text(
+        _local_skill_config(target_dir, work_dir / ".cache", skill_dir)
+    )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(work_dir)
+        mp.setenv("HOME", str(home_dir))
+        result = runner.invoke(app, ["sync"])
+    assert result.exit_code == 0, result.stdout
+
+    return {"config_file": config_file, "target_dir": target_dir}
+
 
 @pytest.fixture
 def cli_test_env(tmp_path, monkeypatch):
     """Set up isolated CLI test environment."""
-    # Create isolated directories
+    # Create isolated directories; the config dir creates home_dir as a parent
     work_dir = tmp_path / "work"
     work_dir.mkdir()
     home_dir = tmp_path / "home"
-    home_dir.mkdir()
+    config_dir = home_dir / ".config" / "skill-manager"
+    os.makedirs(config_dir)
 
     # Set environment
     monkeypatch.chdir(work_dir)
     monkeypatch.setenv("HOME", str(home_dir))
 
-    # Create config directory
-    config_dir = home_dir / ".config" / "skill-manager"
-    config_dir.mkdir(parents=True)
-
     return {
         "work_dir": work_dir,
         "home_dir": home_dir,
@@ -52,7 +127,7 @@ class TestInitCommand:
         assert "Created config file" in result.stdout or "skills.yaml" in result.stdout
 
         # Verify config content
-        config = yaml.safe_load(config_file.read_text())
+        config = _load_yaml(config_file)
         assert config["version"] == "1.0"
         assert "settings" in config
         assert "sources" in config
@@ -86,7 +161,7 @@ class TestInitCommand:
         assert "Created config file" in result.stdout or "skills.yaml" in result.stdout
 
         # Verify it was overwritten
-        config = yaml.safe_load(config_file.read_text())
+        config = _load_yaml(config_file)
         assert config["version"] == "1.0"
 
 
@@ -95,7 +170,7 @@ class TestSyncCommand:
 
     def test_sync_with_no_config(self, cli_test_env):
         """Test sync command with no config file."""
-        result = runner.invoke(app, ["sync"])
+        result = runner.invoke(app, ["sync"], catch_exceptions=False)
 
         # May error if no config found or succeed with nothing to sync
         assert result.exit_code in [0, 1]
@@ -106,20 +181,14 @@ class TestSyncCommand:
 
         # Create config
         config_file = work_dir / "skills.yaml"
-        config = {
-            "version": "1.0",
-            "settings": {
-                "target_dirs": [str(work_dir / ".claude" / "skills")],
-                "cache_dir": str(work_dir / ".cache"),
-            },
-            "skills": [
-                {
-                    "name": "local-skill",
-                    "path": str(sample_skill_dir),
-                }
-            ],
-        }
-        config_file.write_text(yaml.dump(config))
+        config_file.write_text(
+            _local_skill_config(
+                work_dir / ".claude" / "skills",
+                work_dir / ".cache",
+                sample_skill_dir,
+                name="local-skill",
+            )
+        )
 
         result = runner.invoke(app, ["sync"])
 
@@ -137,20 +206,9 @@ class TestSyncCommand:
 
         # Create config
         config_file = work_dir / "skills.yaml"
-        config = {
-            "version": "1.0",
-            "settings": {
-                "target_dirs": [str(target_dir)],
-                "cache_dir": str(work_dir / ".cache"),
-            },
-            "skills": [
-                {
-                    "name": "test-skill",
-                    "path": str(sample_skill_dir),
-                }
-            ],
-        }
-        config_file.write_text(yaml.dump(config))
+        config_file.write_text(
+            _local_skill_config(target_dir, work_dir / ".cache", sample_skill_dir)
+        )
 
         result = runner.invoke(app, ["sync"])
         assert result.exit_code == 0
@@ -174,39 +232,16 @@ class TestListCommand:
 
     def test_list_command_runs(self, cli_test_env):
         """Test list command runs successfully."""
-        result = runner.invoke(app, ["list"])
+        result = runner.invoke(app, ["list"], catch_exceptions=False)
 
         # Should complete successfully even with no config
         assert result.exit_code in [0, 1]  # May error if no target dir or succeed with empty list
 
-    def test_list_with_synced_skills(self, cli_test_env, sample_skill_dir):
+    def test_list_with_synced_skills(self, cli_test_env, synced_env):
         """Test list command with synced skills."""
-        work_dir = cli_test_env["work_dir"]
-        target_dir = work_dir / ".claude" / "skills"
-
-        # Create config and sync
-        config_file = work_dir / "skills.yaml"
-        config = {
-            "version": "1.0",
-            "settings": {
-                "target_dirs": [str(target_dir)],
-                "cache_dir": str(work_dir / ".cache"),
-            },
-            "skills": [
-                {
-                    "name": "test-skill",
-                    "path": str(sample_skill_dir),
-                }
-            ],
-        }
-        config_file.write_text(yaml.dump(config))
-
-        # Sync first
-        sync_result = runner.invoke(app, ["sync"])
-        assert sync_result.exit_code == 0
-
-        # Now list
-        result = runner.invoke(app, ["list"])
+        result = runner.invoke(
+            app, ["list", "--config", str(synced_env["config_file"])]
+        )
 
         assert result.exit_code == 0
         assert "test-skill" in result.stdout
@@ -222,20 +257,9 @@ class TestRemoveCommand:
 
         # Create config and sync
         config_file = work_dir / "skills.yaml"
-        config = {
-            "version": "1.0",
-            "settings": {
-                "target_dirs": [str(target_dir)],
-                "cache_dir": str(work_dir / ".cache"),
-            },
-            "skills": [
-                {
-                    "name": "test-skill",
-                    "path": str(sample_skill_dir),
-                }
-            ],
-        }
-        config_file.write_text(yaml.dump(config))
+        config_file.write_text(
+            _local_skill_config(target_dir, work_dir / ".cache", sample_skill_dir)
+        )
 
         # Sync first
         sync_result = runner.invoke(app, ["sync"])
@@ -257,7 +281,9 @@ class TestRemoveCommand:
 
     def test_remove_nonexistent_skill(self, cli_test_env):
         """Test removing a skill that doesn't exist."""
-        result = runner.invoke(app, ["remove", "nonexistent-skill"])
+        result = runner.invoke(
+            app, ["remove", "nonexistent-skill"], catch_exceptions=False
+        )
 
         # May succeed with warning or fail
         assert result.exit_code in [0, 1]
@@ -270,7 +296,7 @@ class TestCacheCommands:
         """Test that cache commands are available."""
         # Note: Actual cache commands may not exist in CLI yet
         # This is a placeholder for when they're implemented
-        result = runner.invoke(app, ["--help"])
+        result = runner.invoke(app, ["--help"], catch_exceptions=False)
         assert result.exit_code == 0
 
 
@@ -279,7 +305,7 @@ class TestConfigCommands:
 
     def test_config_help(self, cli_test_env):
         """Test config command help."""
-        result = runner.invoke(app, ["config", "--help"])
+        result = runner.invoke(app, ["config", "--help"], catch_exceptions=False)
         assert result.exit_code == 0
         assert "config" in result.stdout.lower()
 
@@ -300,7 +326,7 @@ class TestValidateCommand:
             "sources": {},
             "skills": [],
         }
-        config_file.write_text(yaml.dump(config))
+        config_file.write_text(_dump_yaml(config))
 
         result = runner.invoke(app, ["validate"])
 
@@ -315,7 +341,7 @@ class TestValidateCommand:
         config = {
             "version": "2.0",  # Invalid version
         }
-        config_file.write_text(yaml.dump(config))
+        config_file.write_text(_dump_yaml(config))
 
         result = runner.invoke(app, ["validate"])
 
@@ -355,7 +381,7 @@ class TestCLIWithComposedSkills:
                 }
             ],
         }
-        config_file.write_text(yaml.dump(config))
+        config_file.write_text(_dump_yaml(config))
 
         result = runner.invoke(app, ["sync"])
 
@@ -392,7 +418,7 @@ class TestCLIEdgeCases:
                 }
             ],
         }
-        config_file.write_text(yaml.dump(config))
+        config_file.write_text(_dump_yaml(config))
 
         result = runner.invoke(app, ["sync"])
 
@@ -404,20 +430,11 @@ class TestCLIEdgeCases:
 
         # Create config in non-standard location
         custom_config = work_dir / "custom-config.yaml"
-        config = {
-            "version": "1.0",
-            "settings": {
-                "target_dirs": [str(work_dir / "custom-target")],
-                "cache_dir": str(work_dir / ".cache"),
-            },
-            "skills": [
-                {
-                    "name": "test-skill",
-                    "path": str(sample_skill_dir),
-                }
-            ],
-        }
-        custom_config.write_text(yaml.dump(config))
+        custom_config.write_text(
+            _local_skill_config(
+                work_dir / "custom-target", work_dir / ".cache", sample_skill_dir
+            )
+        )
 
         result = runner.invoke(app, ["sync", "--config", str(custom_config)])
 
@@ -431,32 +448,12 @@ class TestCLIEdgeCases:
 class TestCLIOutput:
     """Test CLI output formatting."""
 
-    def test_list_displays_output(self, cli_test_env, sample_skill_dir):
+    def test_list_displays_output(self, cli_test_env, synced_env):
         """Test that list command displays results."""
-        work_dir = cli_test_env["work_dir"]
-        target_dir = work_dir / ".claude" / "skills"
-
-        # Sync a skill first
-        config_file = work_dir / "skills.yaml"
-        config = {
-            "version": "1.0",
-            "settings": {
-                "target_dirs": [str(target_dir)],
-                "cache_dir": str(work_dir / ".cache"),
-            },
-            "skills": [
-                {
-                    "name": "test-skill",
-                    "path": str(sample_skill_dir),
-                }
-            ],
-        }
-        config_file.write_text(yaml.dump(config))
-
-        runner.invoke(app, ["sync"])
-
-        # List skills
-        result = runner.invoke(app, ["list"])
+        # List skills synced by the shared fixture
+        result = runner.invoke(
+            app, ["list", "--config", str(synced_env["config_file"])]
+        )
 
         assert result.exit_code == 0
         # Should contain skill name in output
@@ -16,6 +16,52 @@ from skill_manager.config.loader import (
 )
 from skill_manager.config.schema import SkillManagerConfig
 
+# Static YAML inputs written verbatim, so no test pays for yaml.dump
+_PROJECT_CACHE_YAML = """\
+version: '1.0'
+settings:
+  cache_dir: /project/cache
+"""
+
+_CUSTOM_BRANCH_YAML = """\
+version: '1.0'
+settings:
+  default_branch: custom
+"""
+
+_INVALID_VERSION_YAML = """\
+version: '2.0'  # Invalid version
+"""
+
+_PROJECT_CACHE_AND_BRANCH_YAML = """\
+version: '1.0'
+settings:
+  cache_dir: /project/cache
+  default_branch: project-branch
+"""
+
+_USER_CACHE_YAML = """\
+version: '1.0'
+settings:
+  cache_dir: /user/cache
+"""
+
+_FULL_CONFIG_YAML = """\
+version: '1.0'
+settings:
+  target_dirs:
+    - .claude/skills
+  cache_dir: ~/.cache/skill-manager
+sources:
+  github-source:
+    type: github
+    repo: owner/repo
+    path: skills
+skills:
+  - name: test-skill
+    source: github-source
+"""
+
 
 class TestLoadYamlFile:
     """Test YAML file loading."""
@@ -23,11 +69,7 @@ class TestLoadYamlFile:
     def test_load_valid_yaml(self, tmp_path):
         """Test loading a valid YAML file."""
         config_file = tmp_path / "config.yaml"
-        config_data = {
-            "version": "1.0",
-            "settings": {"cache_dir": "/custom/cache"},
-        }
-        config_file.write_text(yaml.dump(config_data))
+        config_file.write_text("version: '1.0'\nsettings:\n  cache_dir: /custom/cache\n")
 
         result = load_yaml_file(config_file)
         assert result["version"] == "1.0"
@@ -56,6 +98,26 @@ class TestLoadYamlFile:
         with pytest.raises(yaml.YAMLError):
             load_yaml_file(config_file)
 
+    def test_repeat_load_returns_independent_copies(self, tmp_path):
+        """Test that mutating a loaded config does not leak into later loads."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("settings:\n  cache_dir: /cache\n")
+
+        first = load_yaml_file(config_file)
+        first["settings"]["cache_dir"] = "/mutated"
+
+        second = load_yaml_file(config_file)
+        assert second["settings"]["cache_dir"] == "/cache"
+
+    def test_reload_after_file_change(self, tmp_path):
+        """Test that an edited file is parsed again rather than served stale."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("version: '1.0'\n")
+        assert load_yaml_file(config_file)["version"] == "1.0"
+
+        config_file.write_text("version: '1.10'\n")
+        assert load_yaml_file(config_file)["version"] == "1.10"
+
 
 class TestMergeConfigs:
     """Test configuration merging logic."""
@@ -109,6 +171,17 @@ class TestMergeConfigs:
         result = merge_configs([config1, config2])
         assert result["skills"] == ["skill3"]  # Completely replaced
 
+    def test_merge_does_not_mutate_inputs(self):
+        """Test that merging leaves the input configs untouched."""
+        config1 = {"settings": {"cache_dir": "/cache1"}}
+        config2 = {"settings": {"default_branch": "dev"}}
+        config3 = {"settings": {"cache_dir": "/cache3"}}
+
+        merge_configs([config1, config2, config3])
+        assert config1 == {"settings": {"cache_dir": "/cache1"}}
+        assert config2 == {"settings": {"default_branch": "dev"}}
+        assert config3 == {"settings": {"cache_dir": "/cache3"}}
+
     def test_merge_multiple_configs(self):
         """Test merging multiple configs in precedence order."""
         config1 = {"a": 1, "b": 2}
@@ -269,20 +342,27 @@ class TestLoadConfig:
         assert ".claude/skills" in config.settings.target_dirs
         assert "skill-manager" in config.settings.cache_dir
 
+    def test_load_default_config_returns_independent_copies(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that mutating a defaults-only config does not leak into later loads."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        first = load_config()
+        first.settings.target_dirs.append("/mutated")
+
+        second = load_config()
+        assert second is not first
+        assert second.settings.target_dirs == [".claude/skills"]
+
     def test_load_with_project_config(self, tmp_path, monkeypatch):
         """Test loading with project config override."""
         monkeypatch.chdir(tmp_path)
         monkeypatch.setenv("HOME", str(tmp_path / "home"))
 
         project_config = tmp_path / "skills.yaml"
-        project_config.write_text(
-            yaml.dump(
-                {
-                    "version": "1.0",
-                    "settings": {"cache_dir": "/project/cache"},
-                }
-            )
-        )
+        project_config.write_text(_PROJECT_CACHE_YAML)
 
         config = load_config()
         assert config.settings.cache_dir == "/project/cache"
@@ -293,14 +373,7 @@ class TestLoadConfig:
         monkeypatch.setenv("HOME", str(tmp_path / "home"))
 
         explicit_config = tmp_path / "custom.yaml"
-        explicit_config.write_text(
-            yaml.dump(
-                {
-                    "version": "1.0",
-                    "settings": {"default_branch": "custom"},
-                }
-            )
-        )
+        explicit_config.write_text(_CUSTOM_BRANCH_YAML)
 
         config = load_config(config_path=explicit_config)
         assert config.settings.default_branch == "custom"
@@ -312,14 +385,7 @@ class TestLoadConfig:
         monkeypatch.setenv("SKILL_MANAGER_CACHE_DIR", "/env/cache")
 
         project_config = tmp_path / "skills.yaml"
-        project_config.write_text(
-            yaml.dump(
-                {
-                    "version": "1.0",
-                    "settings": {"cache_dir": "/project/cache"},
-                }
-            )
-        )
+        project_config.write_text(_PROJECT_CACHE_YAML)
 
         config = load_config()
         assert config.settings.cache_dir == "/env/cache"  # Env wins
@@ -330,13 +396,24 @@ class TestLoadConfig:
         monkeypatch.setenv("HOME", str(tmp_path / "home"))
 
         project_config = tmp_path / "skills.yaml"
-        project_config.write_text(
-            yaml.dump(
-                {
-                    "version": "2.0",  # Invalid version
-                }
-            )
-        )
+        project_config.write_text(_INVALID_VERSION_YAML)
+
+        with pytest.raises(ValidationError):
+            load_config()
+
+    @pytest.mark.parametrize(
+        "settings_yaml",
+        ["settings: [a, b]", "settings: garbage", "settings:"],
+    )
+    def test_load_non_mapping_settings_raises_error(
+        self, tmp_path, monkeypatch, settings_yaml
+    ):
+        """Test that a settings value that is not a mapping is rejected."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+
+        project_config = tmp_path / "skills.yaml"
+        project_config.write_text(f'version: "1.0"\n{settings_yaml}\n')
 
         with pytest.raises(ValidationError):
             load_config()
@@ -356,32 +433,13 @@ class TestLoadConfig:
 
         # Create project config
         project_config = tmp_path / "skills.yaml"
-        project_config.write_text(
-            yaml.dump(
-                {
-                    "version": "1.0",
-                    "settings": {
-                        "cache_dir": "/project/cache",
-                        "default_branch": "project-branch",
-                    },
-                }
-            )
-        )
+        project_config.write_text(_PROJECT_CACHE_AND_BRANCH_YAML)
 
         # Create user config
         user_config_dir = tmp_path / ".config" / "skill-manager"
         user_config_dir.mkdir(parents=True)
         user_config = user_config_dir / "skills.yaml"
-        user_config.write_text(
-            yaml.dump(
-                {
-                    "version": "1.0",
-                    "settings": {
-                        "cache_dir": "/user/cache",
-                    },
-                }
-            )
-        )
+        user_config.write_text(_USER_CACHE_YAML)
 
         config = load_config()
 
@@ -402,30 +460,7 @@ class TestConfigIntegration:
         monkeypatch.setenv("HOME", str(tmp_path / "home"))
 
         config_file = tmp_path / "skills.yaml"
-        config_file.write_text(
-            yaml.dump(
-                {
-                    "version": "1.0",
-                    "settings": {
-                        "target_dirs": [".claude/skills"],
-                        "cache_dir": "~/.cache/skill-manager",
-                    },
-                    "sources": {
-                        "github-source": {
-                            "type": "github",
-                            "repo": "owner/repo",
-                            "path": "skills",
-                        }
-                    },
-                    "skills": [
-                        {
-                            "name": "test-skill",
-                            "source": "github-source",
-                        }
-                    ],
-                }
-            )
-        )
+        config_file.write_text(_FULL_CONFIG_YAML)
 
         config = load_config()
         assert isinstance(config, SkillManagerConfig)
@@ -1,7 +1,7 @@
 """Tests for non-markdown file composer."""
 
-import tempfile
-from pathlib import Path
+import errno
+import os
 
 import pytest
 
@@ -11,16 +11,22 @@ from skill_manager.core.skill import SkillSource
 
 
 @pytest.fixture
-def temp_skill_dir():
-    """Create a temporary directory for skill testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_skill_dir(tmp_path):
+    """Provide a temporary directory for skill testing.
 
+    Uses pytest's tmp_path, which conftest places on tmpfs, so these file
+    writes stay in RAM alongside the module-scoped skills.
+    """
+    return tmp_path
 
-@pytest.fixture
-def default_skill(temp_skill_dir):
-    """Create a default-level skill with non-markdown files."""
-    skill_path = temp_skill_dir / "default_skill"
+
+@pytest.fixture(scope="module")
+def default_skill(tmp_path_factory):
+    """Create a default-level skill with non-markdown files.
+
+    Shared by every test in this module, so it must be treated as read-only.
+    """
+    skill_path = tmp_path_factory.mktemp("skill_mod") / "default_skill"
     skill_path.mkdir()
 
     # Create SKILL.md
@@ -51,10 +57,13 @@ description: A default skill
     )
 
 
-@pytest.fixture
-def user_skill(temp_skill_dir):
-    """Create a user-level skill with non-markdown files."""
-    skill_path = temp_skill_dir / "user_skill"
+@pytest.fixture(scope="module")
+def user_skill(tmp_path_factory):
+    """Create a user-level skill with non-markdown files.
+
+    Shared by every test in this module, so it must be treated as read-only.
+    """
+    skill_path = tmp_path_factory.mktemp("skill_mod") / "user_skill"
     skill_path.mkdir()
 
     # Create SKILL.md
@@ -301,3 +310,118 @@ def test_compose_binary_files(temp_skill_dir):
     assert (output_dir / "image.png").exists()
     assert (output_dir / "image.png").read_bytes() == binary_content
     assert len(manifest) == 1
+
+
+def test_compose_preserves_executable_bit(temp_skill_dir):
+    """Test that executable scripts stay executable after composition."""
+    skill_path = temp_skill_dir / "script_skill"
+    skill_path.mkdir()
+    (skill_path / "SKILL.md").write_text("# Script Skill\n")
+    script = skill_path / "run.sh"
+    script.write_text("#!/bin/bash\necho 'run'\n")
+    script.chmod(0o755)
+
+    skill_source = SkillSource(name="script-skill", path=skill_path)
+    output_dir = temp_skill_dir / "output"
+    compose_non_markdown_files([(skill_source, PrecedenceLevel.DEFAULT)], output_dir)
+
+    assert (output_dir / "run.sh").stat().st_mode & 0o111
+
+
+def test_compose_with_hardlinks(temp_skill_dir):
+    """Test that use_hardlinks links files instead of copying them."""
+    # Source and output share temp_skill_dir, so linking cannot hit EXDEV
+    skill_path = temp_skill_dir / "link_skill"
+    skill_path.mkdir()
+    (skill_path / "SKILL.md").write_text("# Link Skill\n")
+    source_script = skill_path / "script.py"
+    source_script.write_text("print('linked')\n")
+
+    skill_source = SkillSource(name="link-skill", path=skill_path)
+    output_dir = temp_skill_dir / "output"
+    sources = [(skill_source, PrecedenceLevel.DEFAULT)]
+
+    manifest = compose_non_markdown_files(sources, output_dir, use_hardlinks=True)
+
+    output_script = output_dir / "script.py"
+    assert output_script.read_text() == "print('linked')\n"
+    assert output_script.samefile(source_script)
+    assert len(manifest) == 1
+
+
+def test_compose_skips_dangling_symlinks(temp_skill_dir):
+    """Test that a dangling symlink in a skill is skipped, not copied."""
+    skill_path = temp_skill_dir / "link_skill"
+    skill_path.mkdir()
+    (skill_path / "script.py").write_text("print('hi')\n")
+    (skill_path / "dangling.txt").symlink_to(skill_path / "missing.txt")
+
+    output_dir = temp_skill_dir / "output"
+    sources = [(SkillSource(name="link-skill", path=skill_path), PrecedenceLevel.DEFAULT)]
+
+    manifest = compose_non_markdown_files(sources, output_dir)
+
+    assert set(manifest) == {str(output_dir / "script.py")}
+    assert not os.path.lexists(output_dir / "dangling.txt")
+
+
+def test_compose_into_existing_output_twice(temp_skill_dir):
+    """Test that re-composing over hard-linked output replaces it safely."""
+    skill_path = temp_skill_dir / "link_skill"
+    skill_path.mkdir()
+    source_script = skill_path / "script.py"
+    source_script.write_text("print('linked')\n")
+    other_path = temp_skill_dir / "other_skill"
+    other_path.mkdir()
+    (other_path / "script.py").write_text("print('other')\n")
+
+    output_dir = temp_skill_dir / "output"
+    linked = [(SkillSource(name="link-skill", path=skill_path), PrecedenceLevel.DEFAULT)]
+    other = [(SkillSource(name="other-skill", path=other_path), PrecedenceLevel.DEFAULT)]
+
+    compose_non_markdown_files(linked, output_dir, use_hardlinks=True)
+    compose_non_markdown_files(linked, output_dir, use_hardlinks=True)
+    assert (output_dir / "script.py").samefile(source_script)
+
+    # Copying different content over the link must not write through it
+    compose_non_markdown_files(other, output_dir)
+    assert (output_dir / "script.py").read_text() == "print('other')\n"
+    assert source_script.read_text() == "print('linked')\n"
+
+
+def test_compose_hardlinks_fall_back_to_copy(temp_skill_dir, default_skill, monkeypatch):
+    """Test that a cross-device link error falls back to copying."""
+
+    def cross_device_link(src, dst):
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+    monkeypatch.setattr(os, "link", cross_device_link)
+
+    output_dir = temp_skill_dir / "output"
+    sources = [(default_skill, PrecedenceLevel.DEFAULT)]
+
+    compose_non_markdown_files(sources, output_dir, use_hardlinks=True)
+
+    output_script = output_dir / "script.py"
+    assert output_script.read_text() == "print('default script')\n"
+    assert not output_script.samefile(default_skill.path / "script.py")
+
+
+def test_compose_many_files(temp_skill_dir):
+    """Test composing enough files to take the parallel copy path."""
+    skill_path = temp_skill_dir / "large_skill"
+    (skill_path / "data").mkdir(parents=True)
+    (skill_path / "SKILL.md").write_text("# Large Skill\n")
+    for i in range(40):
+        (skill_path / "data" / f"file_{i}.txt").write_text(f"content {i}\n")
+
+    skill_source = SkillSource(name="large-skill", path=skill_path)
+    output_dir = temp_skill_dir / "output"
+
+    manifest = compose_non_markdown_files(
+        [(skill_source, PrecedenceLevel.DEFAULT)], output_dir
+    )
+
+    assert len(manifest) == 40
+    for i in range(40):
+        assert (output_dir / "data" / f"file_{i}.txt").read_text() == f"content {i}\n"
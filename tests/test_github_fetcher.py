@@ -1,5 +1,7 @@
 """Tests for GitHub fetcher with mocked API responses."""
 
+import asyncio
+import tracemalloc
 from pathlib import Path
 
 import httpx
@@ -9,16 +11,67 @@ import respx
 from skill_manager.fetch.github import GitHubFetcher
 
 
-@pytest.fixture
-def github_fetcher():
-    """Create a GitHubFetcher instance."""
-    return GitHubFetcher()
+@pytest.fixture(scope="module")
+async def github_fetcher(anyio_backend):
+    """Create a GitHubFetcher shared by the module, so its client is reused."""
+    fetcher = GitHubFetcher()
+    yield fetcher
+    await fetcher.aclose()
 
 
 @pytest.fixture
-def github_fetcher_with_token():
+async def github_fetcher_with_token(anyio_backend):
     """Create a GitHubFetcher instance with token."""
-    return GitHubFetcher(token="test-token-123")
+    fetcher = GitHubFetcher(token="test-token-123")
+    yield fetcher
+    await fetcher.aclose()
+
+
+CONTENTS_BASE = "https://api.github.com/repos/owner/repo/contents"
+RAW_BASE = "https://raw.githubusercontent.com/owner/repo/main"
+
+MY_SKILL_MD = b"""---
+name: my-skill
+description: Test skill
+---
+
+# My Skill
+"""
+
+
+def _mock_skill(respx_mock, path: str, files: dict[str, bytes]) -> respx.Route:
+    """Mock a flat skill directory listing and the download of each file.
+
+    Args:
+        respx_mock: Router to register the routes on
+        path: Skill path within the repository
+        files: File contents keyed by file name
+
+    Returns:
+        The route for the directory listing
+    """
+    listing = [
+        {
+            "type": "file",
+            "name": name,
+            "path": f"{path}/{name}",
+            "download_url": f"{RAW_BASE}/{path}/{name}",
+        }
+        for name in files
+    ]
+    for name, content in files.items():
+        respx_mock.get(f"{RAW_BASE}/{path}/{name}").mock(
+            return_value=httpx.Response(200, content=content)
+        )
+    return respx_mock.get(f"{CONTENTS_BASE}/{path}").mock(
+        return_value=httpx.Response(200, json=listing)
+    )
+
+
+@pytest.fixture
+def mock_simple_skill(respx_mock):
+    """Mock skills/my-skill with a single SKILL.md; returns the listing route."""
+    return _mock_skill(respx_mock, "skills/my-skill", {"SKILL.md": MY_SKILL_MD})
 
 
 class TestGitHubFetcherInit:
@@ -43,39 +96,10 @@ class TestGitHubFetcherInit:
 class TestGitHubFetcherFetch:
     """Test GitHubFetcher fetch method."""
 
-    @respx.mock
-    async def test_fetch_simple_skill(self, github_fetcher, tmp_path):
+    async def test_fetch_simple_skill(
+        self, github_fetcher, mock_simple_skill, tmp_path
+    ):
         """Test fetching a simple skill with one file."""
-        # Mock GitHub API response for directory listing
-        contents_url = (
-            "https://api.github.com/repos/owner/repo/contents/skills/my-skill"
-        )
-        respx.get(contents_url).mock(
-            return_value=httpx.Response(
-                200,
-                json=[
-                    {
-                        "type": "file",
-                        "name": "SKILL.md",
-                        "path": "skills/my-skill/SKILL.md",
-                        "download_url": "https://raw.githubusercontent.com/owner/repo/main/skills/my-skill/SKILL.md",
-                    }
-                ],
-            )
-        )
-
-        # Mock file download
-        file_content = """---
-name: my-skill
-description: Test skill
----
-
-# My Skill
-"""
-        respx.get(
-            "https://raw.githubusercontent.com/owner/repo/main/skills/my-skill/SKILL.md"
-        ).mock(return_value=httpx.Response(200, content=file_content.encode()))
-
         # Fetch the skill
         target_dir = tmp_path / "my-skill"
         skill = await github_fetcher.fetch(
@@ -192,35 +216,10 @@ description: Test skill
                 target_dir=target_dir,
             )
 
-    @respx.mock
-    async def test_fetch_with_authentication(self, github_fetcher_with_token, tmp_path):
+    async def test_fetch_with_authentication(
+        self, github_fetcher_with_token, mock_simple_skill, tmp_path
+    ):
         """Test that authentication token is included in requests."""
-        # Mock with route to capture request headers
-        route = respx.get(
-            "https://api.github.com/repos/owner/repo/contents/skills/my-skill"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json=[
-                    {
-                        "type": "file",
-                        "name": "SKILL.md",
-                        "path": "skills/my-skill/SKILL.md",
-                        "download_url": "https://raw.githubusercontent.com/owner/repo/main/skills/my-skill/SKILL.md",
-                    }
-                ],
-            )
-        )
-
-        respx.get(
-            "https://raw.githubusercontent.com/owner/repo/main/skills/my-skill/SKILL.md"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                content=b"---\nname: my-skill\n---\n# My Skill",
-            )
-        )
-
         target_dir = tmp_path / "my-skill"
         await github_fetcher_with_token.fetch(
             owner="owner",
@@ -231,33 +230,16 @@ description: Test skill
         )
 
         # Verify Authorization header was sent
-        assert route.called
-        request = route.calls.last.request
+        assert mock_simple_skill.called
+        request = mock_simple_skill.calls.last.request
         assert request.headers["Authorization"] == "Bearer test-token-123"
 
-    @respx.mock
-    async def test_fetch_skill_without_skill_md(self, github_fetcher, tmp_path):
+    async def test_fetch_skill_without_skill_md(
+        self, github_fetcher, respx_mock, tmp_path
+    ):
         """Test fetching skill without SKILL.md succeeds but has no metadata."""
         # Mock response without SKILL.md
-        respx.get(
-            "https://api.github.com/repos/owner/repo/contents/skills/no-skill-md"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                json=[
-                    {
-                        "type": "file",
-                        "name": "README.md",
-                        "path": "skills/no-skill-md/README.md",
-                        "download_url": "https://raw.githubusercontent.com/owner/repo/main/skills/no-skill-md/README.md",
-                    }
-                ],
-            )
-        )
-
-        respx.get(
-            "https://raw.githubusercontent.com/owner/repo/main/skills/no-skill-md/README.md"
-        ).mock(return_value=httpx.Response(200, content=b"# README"))
+        _mock_skill(respx_mock, "skills/no-skill-md", {"README.md": b"# README"})
 
         target_dir = tmp_path / "no-skill-md"
 
@@ -276,106 +258,292 @@ description: Test skill
         # Metadata should be None since no SKILL.md
         assert skill.metadata is None
 
-    @respx.mock
-    async def test_fetch_creates_target_dir(self, github_fetcher, tmp_path):
+    async def test_fetch_creates_target_dir(
+        self, github_fetcher, mock_simple_skill, tmp_path
+    ):
         """Test that fetch creates target directory if it doesn't exist."""
-        respx.get(
-            "https://api.github.com/repos/owner/repo/contents/skills/my-skill"
-        ).mock(
+        # Use nested path that doesn't exist
+        target_dir = tmp_path / "nested" / "path" / "my-skill"
+        assert not target_dir.exists()
+
+        await github_fetcher.fetch(
+            owner="owner",
+            repo="repo",
+            path="skills/my-skill",
+            ref="main",
+            target_dir=target_dir,
+        )
+
+        assert target_dir.exists()
+
+    async def test_fetch_binary_file(self, github_fetcher, respx_mock, tmp_path):
+        """Test fetching skill with binary files."""
+        binary_content = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+        _mock_skill(
+            respx_mock,
+            "skills/with-binary",
+            {
+                "SKILL.md": b"---\nname: with-binary\n---\n# Skill",
+                "image.png": binary_content,
+            },
+        )
+
+        target_dir = tmp_path / "with-binary"
+        await github_fetcher.fetch(
+            owner="owner",
+            repo="repo",
+            path="skills/with-binary",
+            ref="main",
+            target_dir=target_dir,
+        )
+
+        # Verify binary file was written correctly
+        assert (target_dir / "image.png").exists()
+        assert (target_dir / "image.png").read_bytes() == binary_content
+
+    async def test_fetch_streams_large_file(self, github_fetcher, respx_mock, tmp_path):
+        """Test that downloads are streamed to disk rather than buffered whole."""
+        chunk = b"\x00" * (64 * 1024)
+        chunk_count = 160  # 10 MiB in total
+
+        async def body():
+            for _ in range(chunk_count):
+                yield chunk
+
+        respx_mock.get(f"{RAW_BASE}/skills/large/blob.bin").mock(
+            side_effect=lambda request: httpx.Response(200, content=body())
+        )
+        respx_mock.get(f"{CONTENTS_BASE}/skills/large").mock(
             return_value=httpx.Response(
                 200,
                 json=[
                     {
                         "type": "file",
-                        "name": "SKILL.md",
-                        "path": "skills/my-skill/SKILL.md",
-                        "download_url": "https://raw.githubusercontent.com/owner/repo/main/skills/my-skill/SKILL.md",
+                        "name": "blob.bin",
+                        "path": "skills/large/blob.bin",
+                        "download_url": f"{RAW_BASE}/skills/large/blob.bin",
                     }
                 ],
             )
         )
 
-        respx.get(
-            "https://raw.githubusercontent.com/owner/repo/main/skills/my-skill/SKILL.md"
-        ).mock(
-            return_value=httpx.Response(
-                200,
-                content=b"---\nname: my-skill\n---\n# Skill",
+        target_dir = tmp_path / "large"
+        tracemalloc.start()
+        try:
+            await github_fetcher.fetch(
+                owner="owner",
+                repo="repo",
+                path="skills/large",
+                ref="main",
+                target_dir=target_dir,
             )
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        payload_size = len(chunk) * chunk_count
+        assert (target_dir / "blob.bin").stat().st_size == payload_size
+        # Buffering the whole body would need at least payload_size bytes
+        assert peak < payload_size // 4
+
+    async def test_fetch_reuses_speculative_skill_md(
+        self, github_fetcher, mock_simple_skill, respx_mock, tmp_path
+    ):
+        """Test that SKILL.md is requested once when speculation succeeds."""
+        target_dir = tmp_path / "my-skill"
+        await github_fetcher.fetch(
+            owner="owner",
+            repo="repo",
+            path="skills/my-skill",
+            ref="main",
+            target_dir=target_dir,
         )
 
-        # Use nested path that doesn't exist
-        target_dir = tmp_path / "nested" / "path" / "my-skill"
-        assert not target_dir.exists()
+        skill_md_url = f"{RAW_BASE}/skills/my-skill/SKILL.md"
+        skill_md_calls = [
+            call for call in respx_mock.calls if str(call.request.url) == skill_md_url
+        ]
+        assert len(skill_md_calls) == 1
+        assert (target_dir / "SKILL.md").read_bytes() == MY_SKILL_MD
+
+    async def test_speculation_discarded_when_skill_md_absent(
+        self, github_fetcher, respx_mock, tmp_path
+    ):
+        """Test that a speculative SKILL.md is not written if unlisted."""
+        _mock_skill(respx_mock, "skills/no-skill-md", {"README.md": b"# README"})
+        speculative = respx_mock.get(f"{RAW_BASE}/skills/no-skill-md/SKILL.md").mock(
+            return_value=httpx.Response(200, content=b"---\nname: stale\n---\n")
+        )
 
+        target_dir = tmp_path / "no-skill-md"
         await github_fetcher.fetch(
             owner="owner",
             repo="repo",
-            path="skills/my-skill",
+            path="skills/no-skill-md",
             ref="main",
             target_dir=target_dir,
         )
 
-        assert target_dir.exists()
+        assert speculative.call_count <= 1
+        assert not (target_dir / "SKILL.md").exists()
+        assert (target_dir / "README.md").exists()
+
+    async def test_fetch_without_speculation(self, mock_simple_skill, tmp_path):
+        """Test that speculation can be disabled."""
+        async with GitHubFetcher(speculate_skill_md=False) as fetcher:
+            target_dir = tmp_path / "my-skill"
+            await fetcher.fetch(
+                owner="owner",
+                repo="repo",
+                path="skills/my-skill",
+                ref="main",
+                target_dir=target_dir,
+            )
+
+        assert (target_dir / "SKILL.md").read_bytes() == MY_SKILL_MD
+
+    async def test_fetch_revalidates_listing_with_etag(
+        self, mock_simple_skill, tmp_path
+    ):
+        """Test that a repeated listing is revalidated and a 304 reuses the cache."""
+        first_response = mock_simple_skill.return_value
+        first_response.headers["ETag"] = '"abc123"'
+        mock_simple_skill.side_effect = [
+            first_response,
+            httpx.Response(304, headers={"ETag": '"abc123"'}),
+        ]
+
+        async with GitHubFetcher() as fetcher:
+            for attempt in ("first", "second"):
+                target_dir = tmp_path / attempt / "my-skill"
+                await fetcher.fetch(
+                    owner="owner",
+                    repo="repo",
+                    path="skills/my-skill",
+                    ref="main",
+                    target_dir=target_dir,
+                )
+                assert (target_dir / "SKILL.md").read_bytes() == MY_SKILL_MD
+
+        assert mock_simple_skill.call_count == 2
+        first, second = mock_simple_skill.calls
+        assert "If-None-Match" not in first.request.headers
+        assert second.request.headers["If-None-Match"] == '"abc123"'
+
+    async def test_client_is_lazy_and_reused(self):
+        """Test that the HTTP client is created once and closed by aclose()."""
+        async with GitHubFetcher() as fetcher:
+            assert fetcher._client is None
+            client = fetcher._get_client()
+            assert fetcher._get_client() is client
+
+        assert client.is_closed
+        assert fetcher._client is None
 
     @respx.mock
-    async def test_fetch_binary_file(self, github_fetcher, tmp_path):
-        """Test fetching skill with binary files."""
+    async def test_fetch_issues_requests_concurrently(self, github_fetcher, tmp_path):
+        """Test that files in a listing are downloaded concurrently."""
+        raw_base = "https://raw.githubusercontent.com/owner/repo/main/skills/my-skill"
+        names = ["SKILL.md"] + [f"file_{i}.txt" for i in range(4)]
         respx.get(
-            "https://api.github.com/repos/owner/repo/contents/skills/with-binary"
+            "https://api.github.com/repos/owner/repo/contents/skills/my-skill"
         ).mock(
             return_value=httpx.Response(
                 200,
                 json=[
                     {
                         "type": "file",
-                        "name": "SKILL.md",
-                        "path": "skills/with-binary/SKILL.md",
-                        "download_url": "https://raw.githubusercontent.com/owner/repo/main/skills/with-binary/SKILL.md",
-                    },
-                    {
-                        "type": "file",
-                        "name": "image.png",
-                        "path": "skills/with-binary/image.png",
-                        "download_url": "https://raw.githubusercontent.com/owner/repo/main/skills/with-binary/image.png",
-                    },
+                        "name": name,
+                        "path": f"skills/my-skill/{name}",
+                        "download_url": f"{raw_base}/{name}",
+                    }
+                    for name in names
                 ],
             )
         )
 
+        in_flight = 0
+        peak = 0
+
+        async def tracked_download(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, content=b"---\nname: my-skill\n---\n")
+
+        respx.get(url__startswith=raw_base).mock(side_effect=tracked_download)
+
+        await github_fetcher.fetch(
+            owner="owner",
+            repo="repo",
+            path="skills/my-skill",
+            ref="main",
+            target_dir=tmp_path / "my-skill",
+        )
+
+        # Serial downloads would never have more than one request in flight
+        assert peak == len(names)
+
+    @respx.mock
+    async def test_fetch_limits_concurrent_downloads(
+        self, github_fetcher, tmp_path, monkeypatch
+    ):
+        """Test that no more than MAX_CONCURRENT_DOWNLOADS run at once."""
+        monkeypatch.setattr(github_fetcher, "MAX_CONCURRENT_DOWNLOADS", 2)
+        raw_base = "https://raw.githubusercontent.com/owner/repo/main/skills/my-skill"
+        names = [f"file_{i}.txt" for i in range(6)]
         respx.get(
-            "https://raw.githubusercontent.com/owner/repo/main/skills/with-binary/SKILL.md"
+            "https://api.github.com/repos/owner/repo/contents/skills/my-skill"
         ).mock(
             return_value=httpx.Response(
                 200,
-                content=b"---\nname: with-binary\n---\n# Skill",
+                json=[
+                    {
+                        "type": "file",
+                        "name": name,
+                        "path": f"skills/my-skill/{name}",
+                        "download_url": f"{raw_base}/{name}",
+                    }
+                    for name in names
+                ],
             )
         )
 
-        # Mock binary file
-        binary_content = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
-        respx.get(
-            "https://raw.githubusercontent.com/owner/repo/main/skills/with-binary/image.png"
-        ).mock(return_value=httpx.Response(200, content=binary_content))
+        in_flight = 0
+        peak = 0
+
+        async def tracked_download(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, content=b"data")
+
+        respx.get(url__startswith=raw_base).mock(side_effect=tracked_download)
 
-        target_dir = tmp_path / "with-binary"
         await github_fetcher.fetch(
             owner="owner",
             repo="repo",
-            path="skills/with-binary",
+            path="skills/my-skill",
             ref="main",
-            target_dir=target_dir,
+            target_dir=tmp_path / "my-skill",
         )
 
-        # Verify binary file was written correctly
-        assert (target_dir / "image.png").exists()
-        assert (target_dir / "image.png").read_bytes() == binary_content
+        assert peak == 2
 
 
 @pytest.mark.anyio
 class TestGitHubFetcherRetry:
     """Test retry logic for failed requests."""
 
+    @pytest.fixture(autouse=True)
+    def _no_retry_delay(self, monkeypatch):
+        """Retry back-off is real sleeping; skip it so only the logic is tested."""
+        monkeypatch.setattr(GitHubFetcher, "RETRY_DELAY", 0.0)
+
     @respx.mock
     async def test_retry_on_network_error(self, github_fetcher, tmp_path):
         """Test that network errors trigger retries."""
@@ -207,6 +207,22 @@ def test_compose_multiple_markdown_files_in_source(tmp_path):
     assert "Documentation" in content
 
 
+def test_compose_skips_dangling_markdown_symlinks(tmp_path):
+    """Test that a dangling .md symlink is skipped rather than read."""
+    skill_dir = tmp_path / "skill"
+    skill_dir.mkdir()
+
+    (skill_dir / "SKILL.md").write_text("# Main Skill")
+    (skill_dir / "notes.md").symlink_to(skill_dir / "missing.md")
+
+    source = SkillSource(name="dangling-md", path=skill_dir)
+
+    output_path = tmp_path / "output" / "SKILL.md"
+    compose_markdown_files([(source, PrecedenceLevel.DEFAULT)], output_path)
+
+    assert "Main Skill" in output_path.read_text()
+
+
 def test_compose_strips_whitespace_but_preserves_structure(tmp_path):
     """Test that leading/trailing whitespace is stripped but internal structure preserved."""
     skill_dir = tmp_path / "skill"
@@ -1,29 +1,41 @@
 """Tests for the skill registry."""
 
 import json
-import tempfile
+from dataclasses import fields
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
+from skill_manager.core import registry as registry_module
 from skill_manager.core.registry import SkillRegistry
 from skill_manager.core.skill import Skill
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-
 @pytest.fixture
 def registry(temp_dir):
     """Create a registry instance for testing."""
     return SkillRegistry(temp_dir)
 
 
+@pytest.fixture
+def registry_with_skill(registry):
+    """Provide a registry whose in-memory manifest already holds test-skill."""
+    registry._manifest_data = {
+        "version": "1.0",
+        "skills": {
+            "test-skill": {
+                "name": "test-skill",
+                "path": "/path/to/skill",
+                "description": "Test description",
+                "composed_from": [],
+                "installed_at": "2024-01-01T00:00:00Z",
+            }
+        },
+    }
+    return registry
+
+
 class TestSkillRegistry:
     """Test suite for SkillRegistry."""
 
@@ -93,6 +105,14 @@ class TestSkillRegistry:
         assert skill_data["composed_from"] == ["source1", "source2"]
         assert "installed_at" in skill_data
 
+    def test_manifest_entry_covers_all_skill_fields(self, registry):
+        """Test that a manifest entry has exactly one key per Skill field."""
+        registry.load()
+        registry.add_skill(Skill(name="test-skill", path=Path("/path/to/skill")))
+
+        entry = registry.get_skill("test-skill")
+        assert set(entry) == {f.name for f in fields(Skill)}
+
     def test_add_skill_with_timestamp(self, registry):
         """Test that add_skill sets installed_at timestamp."""
         skill = Skill(
@@ -109,6 +129,16 @@ class TestSkillRegistry:
         # Verify it's a valid ISO format timestamp
         datetime.fromisoformat(skill_data["installed_at"])
 
+    def test_add_skills_in_batch_get_utc_timestamps(self, registry):
+        """Test that skills added back to back all get UTC timestamps."""
+        registry.load()
+        for i in range(3):
+            registry.add_skill(Skill(name=f"skill{i}", path=Path(f"/path/{i}")))
+
+        for skill_data in registry.list_skills():
+            installed_at = datetime.fromisoformat(skill_data["installed_at"])
+            assert installed_at.utcoffset() == timezone.utc.utcoffset(None)
+
     def test_add_skill_preserves_timestamp(self, registry):
         """Test that add_skill preserves existing installed_at timestamp."""
         timestamp = "2024-01-01T00:00:00Z"
@@ -124,39 +154,22 @@ class TestSkillRegistry:
         skill_data = registry.get_skill("test-skill")
         assert skill_data["installed_at"] == timestamp
 
-    def test_remove_skill(self, registry):
+    def test_remove_skill(self, registry_with_skill):
         """Test removing a skill from the registry."""
-        skill = Skill(
-            name="test-skill",
-            path=Path("/path/to/skill"),
-        )
-
-        registry.load()
-        registry.add_skill(skill)
-
-        assert registry.get_skill("test-skill") is not None
+        assert registry_with_skill.get_skill("test-skill") is not None
 
-        registry.remove_skill("test-skill")
+        registry_with_skill.remove_skill("test-skill")
 
-        assert registry.get_skill("test-skill") is None
+        assert registry_with_skill.get_skill("test-skill") is None
 
     def test_remove_nonexistent_skill(self, registry):
         """Test removing a skill that doesn't exist (should not raise error)."""
         registry.load()
         registry.remove_skill("nonexistent-skill")  # Should not raise
 
-    def test_get_skill(self, registry):
+    def test_get_skill(self, registry_with_skill):
         """Test getting a skill's metadata."""
-        skill = Skill(
-            name="test-skill",
-            path=Path("/path/to/skill"),
-            description="Test description"
-        )
-
-        registry.load()
-        registry.add_skill(skill)
-
-        skill_data = registry.get_skill("test-skill")
+        skill_data = registry_with_skill.get_skill("test-skill")
         assert skill_data["name"] == "test-skill"
         assert skill_data["description"] == "Test description"
 
@@ -188,43 +201,30 @@ class TestSkillRegistry:
         assert "skill1" in skill_names
         assert "skill2" in skill_names
 
+    def test_list_skill_fields(self, registry_with_skill):
+        """Test projecting selected fields of every skill."""
+        rows = registry_with_skill.list_skill_fields("name", "path", "missing", default="")
+        assert rows == [("test-skill", "/path/to/skill", "")]
+
     def test_detect_conflicts_none(self, registry):
         """Test conflict detection when no conflicts exist."""
         registry.load()
         conflicts = registry.detect_conflicts("new-skill")
         assert conflicts == []
 
-    def test_detect_conflicts_exists(self, registry):
+    def test_detect_conflicts_exists(self, registry_with_skill):
         """Test conflict detection when skill already exists."""
-        skill = Skill(name="existing-skill", path=Path("/path/to/skill"))
+        conflicts = registry_with_skill.detect_conflicts("test-skill")
+        assert conflicts == ["test-skill"]
 
-        registry.load()
-        registry.add_skill(skill)
-
-        conflicts = registry.detect_conflicts("existing-skill")
-        assert len(conflicts) == 1
-        assert "existing-skill" in conflicts
-
-    def test_has_skill(self, registry):
+    def test_has_skill(self, registry_with_skill):
         """Test checking if a skill is installed."""
-        skill = Skill(name="test-skill", path=Path("/path/to/skill"))
-
-        registry.load()
+        assert registry_with_skill.has_skill("test-skill")
+        assert not registry_with_skill.has_skill("other-skill")
 
-        assert not registry.has_skill("test-skill")
-
-        registry.add_skill(skill)
-
-        assert registry.has_skill("test-skill")
-
-    def test_get_skill_path(self, registry):
+    def test_get_skill_path(self, registry_with_skill):
         """Test getting the path to an installed skill."""
-        skill = Skill(name="test-skill", path=Path("/path/to/skill"))
-
-        registry.load()
-        registry.add_skill(skill)
-
-        path = registry.get_skill_path("test-skill")
+        path = registry_with_skill.get_skill_path("test-skill")
         assert path == Path("/path/to/skill")
 
     def test_get_skill_path_nonexistent(self, registry):
@@ -339,3 +339,59 @@ class TestSkillRegistry:
         manifest = registry.load()
         assert manifest["version"] == "1.0"
         assert manifest["skills"] == {}
+
+    def test_save_replaces_manifest_atomically(self, registry_with_skill):
+        """Test that save renames a complete file into place and leaves no temp file."""
+        registry_with_skill.save()
+
+        manifest_dir = registry_with_skill.manifest_path.parent
+        assert [p.name for p in manifest_dir.iterdir()] == [
+            ".skill-manager-manifest.json"
+        ]
+
+    def test_save_removes_temp_file_on_failure(self, registry_with_skill, monkeypatch):
+        """Test that a failed rename leaves neither a manifest nor a temp file."""
+        def failing_replace(src, dst):
+            raise OSError("rename failed")
+
+        monkeypatch.setattr(registry_module.os, "replace", failing_replace)
+
+        with pytest.raises(OSError):
+            registry_with_skill.save()
+
+        assert list(registry_with_skill.manifest_path.parent.iterdir()) == []
+
+    def test_save_skips_unchanged_manifest(self, registry_with_skill):
+        """Test that saving identical content leaves the existing file untouched."""
+        registry_with_skill.save()
+        inode = registry_with_skill.manifest_path.stat().st_ino
+
+        registry_with_skill.save()
+        assert registry_with_skill.manifest_path.stat().st_ino == inode
+
+        registry_with_skill.remove_skill("test-skill")
+        registry_with_skill.save()
+        assert registry_with_skill.manifest_path.stat().st_ino != inode
+
+    def test_serializers_write_identical_manifests(self, monkeypatch):
+        """Test that orjson and the stdlib json module write the same bytes."""
+        orjson = pytest.importorskip("orjson")
+        data = {
+            "version": "1.0",
+            "skills": {
+                "café-skill": {
+                    "name": "café-skill",
+                    "description": "Überprüft 日本語 text — with emoji 🚀",
+                    "composed_from": [],
+                    "metadata": {},
+                }
+            },
+        }
+
+        monkeypatch.setattr(registry_module, "orjson", orjson)
+        fast = registry_module._dumps(data)
+        monkeypatch.setattr(registry_module, "orjson", None)
+        stdlib = registry_module._dumps(data)
+
+        assert fast == stdlib
+        assert registry_module._loads(fast) == data
@@ -1,5 +1,8 @@
 """Tests for URL and source resolution."""
 
+from dataclasses import FrozenInstanceError
+from types import MappingProxyType
+
 import pytest
 
 from skill_manager.config.schema import (
@@ -12,101 +15,125 @@ from skill_manager.core.resolver import (
     ResolvedSource,
     parse_github_url,
     resolve_compose_item,
+    resolve_compose_items,
     resolve_source,
 )
 
+# Source configurations shared by the tests below. Built once at import and
+# wrapped read-only so a test cannot leak changes into another.
+_GITHUB_SOURCE = SourceConfig(
+    type=SourceType.GITHUB,
+    repo="owner/repo",
+    path="skills",
+    branch="main",
+)
+_SOURCES_BASIC = MappingProxyType({"my-source": _GITHUB_SOURCE})
+_SOURCES_NO_BRANCH = MappingProxyType(
+    {"my-source": SourceConfig(type=SourceType.GITHUB, repo="owner/repo", path="skills")}
+)
+_SOURCES_NO_PATH = MappingProxyType(
+    {"my-source": SourceConfig(type=SourceType.GITHUB, repo="owner/repo")}
+)
+_SOURCES_NO_PATH_MAIN = MappingProxyType(
+    {"my-source": SourceConfig(type=SourceType.GITHUB, repo="owner/repo", branch="main")}
+)
+
 
 class TestParseGitHubUrl:
     """Test GitHub URL parsing."""
 
-    def test_parse_full_url_with_https(self):
-        """Test parsing full HTTPS GitHub URL."""
-        url = "https://github.com/owner/repo/tree/main/path/to/skill"
-        result = parse_github_url(url)
-
-        assert result.type == "github"
-        assert result.owner == "owner"
-        assert result.repo == "repo"
-        assert result.ref == "main"
-        assert result.path == "path/to/skill"
-
-    def test_parse_url_without_https(self):
-        """Test parsing URL without https:// prefix."""
-        url = "github.com/owner/repo/tree/main/skills/my-skill"
-        result = parse_github_url(url)
-
-        assert result.type == "github"
-        assert result.owner == "owner"
-        assert result.repo == "repo"
-        assert result.ref == "main"
-        assert result.path == "skills/my-skill"
-
-    def test_parse_url_with_www(self):
-        """Test parsing URL with www prefix."""
-        url = "https://www.github.com/owner/repo/tree/main/skill"
-        result = parse_github_url(url)
-
-        assert result.type == "github"
-        assert result.owner == "owner"
-        assert result.repo == "repo"
-
-    def test_parse_url_minimal(self):
-        """Test parsing minimal URL (owner/repo only)."""
-        url = "github.com/owner/repo"
-        result = parse_github_url(url)
-
-        assert result.type == "github"
-        assert result.owner == "owner"
-        assert result.repo == "repo"
-        assert result.ref is None
-        assert result.path is None
-
-    def test_parse_url_with_branch_no_path(self):
-        """Test parsing URL with branch but no path."""
-        url = "github.com/owner/repo/tree/develop"
+    @pytest.mark.parametrize(
+        "url,owner,repo,ref,path",
+        [
+            pytest.param(
+                "https://github.com/owner/repo/tree/main/path/to/skill",
+                "owner", "repo", "main", "path/to/skill",
+                id="full-https",
+            ),
+            pytest.param(
+                "github.com/owner/repo/tree/main/skills/my-skill",
+                "owner", "repo", "main", "skills/my-skill",
+                id="no-scheme",
+            ),
+            pytest.param(
+                "https://www.github.com/owner/repo/tree/main/skill",
+                "owner", "repo", "main", "skill",
+                id="www",
+            ),
+            pytest.param(
+                "github.com/owner/repo",
+                "owner", "repo", None, None,
+                id="owner-repo-only",
+            ),
+            pytest.param(
+                "github.com/owner/repo/tree/develop",
+                "owner", "repo", "develop", None,
+                id="branch-no-path",
+            ),
+            pytest.param(
+                "github.com/owner/repo/tree/v1.0.0/skills/my-skill",
+                "owner", "repo", "v1.0.0", "skills/my-skill",
+                id="tag",
+            ),
+            pytest.param(
+                "github.com/owner/repo/tree/main/level1/level2/level3/skill",
+                "owner", "repo", "main", "level1/level2/level3/skill",
+                id="nested-path",
+            ),
+            pytest.param(
+                "github.com/owner/repo/tree/abc123def456/path/to/skill",
+                "owner", "repo", "abc123def456", "path/to/skill",
+                id="commit-sha",
+            ),
+            pytest.param(
+                "github.com/a/b/tree/c/d",
+                "a", "b", "c", "d",
+                id="single-letter",
+            ),
+            pytest.param(
+                "github.com/org123/repo456/tree/v1.2.3/skill789",
+                "org123", "repo456", "v1.2.3", "skill789",
+                id="numeric",
+            ),
+        ],
+    )
+    def test_parse_url(self, url, owner, repo, ref, path):
+        """Test that each supported URL form is split into its components."""
         result = parse_github_url(url)
 
         assert result.type == "github"
-        assert result.owner == "owner"
-        assert result.repo == "repo"
-        assert result.ref == "develop"
-        assert result.path is None
-
-    def test_parse_url_with_tag(self):
-        """Test parsing URL with tag reference."""
-        url = "github.com/owner/repo/tree/v1.0.0/skills/my-skill"
-        result = parse_github_url(url)
-
-        assert result.ref == "v1.0.0"
-        assert result.path == "skills/my-skill"
-
-    def test_parse_url_with_nested_path(self):
-        """Test parsing URL with deeply nested path."""
-        url = "github.com/owner/repo/tree/main/level1/level2/level3/skill"
-        result = parse_github_url(url)
-
-        assert result.path == "level1/level2/level3/skill"
-
-    def test_parse_invalid_url_not_github(self):
-        """Test that non-GitHub URL raises error."""
-        url = "https://gitlab.com/owner/repo"
-
-        with pytest.raises(ValueError, match="Not a GitHub URL"):
-            parse_github_url(url)
-
-    def test_parse_invalid_url_missing_repo(self):
-        """Test that URL with only owner raises error."""
-        url = "github.com/owner"
+        assert (result.owner, result.repo, result.ref, result.path) == (
+            owner,
+            repo,
+            ref,
+            path,
+        )
 
-        with pytest.raises(ValueError, match="Invalid GitHub URL format"):
+    @pytest.mark.parametrize(
+        "url,match",
+        [
+            pytest.param(
+                "https://gitlab.com/owner/repo", "Not a GitHub URL", id="not-github"
+            ),
+            pytest.param(
+                "github.com/owner", "Invalid GitHub URL format", id="missing-repo"
+            ),
+        ],
+    )
+    def test_parse_invalid_url(self, url, match):
+        """Test that malformed or non-GitHub URLs raise ValueError."""
+        with pytest.raises(ValueError, match=match):
             parse_github_url(url)
 
-    def test_parse_url_with_commit_sha(self):
-        """Test parsing URL with commit SHA."""
-        url = "github.com/owner/repo/tree/abc123def456/path/to/skill"
+    def test_parsed_result_is_immutable(self):
+        """Test that memoized parse results cannot be modified by callers."""
+        url = "github.com/owner/repo/tree/main/skills/my-skill"
         result = parse_github_url(url)
 
-        assert result.ref == "abc123def456"
+        with pytest.raises(FrozenInstanceError):
+            result.path = "changed"
+
+        assert parse_github_url(url).path == "skills/my-skill"
 
 
 class TestResolveSource:
@@ -114,14 +141,7 @@ class TestResolveSource:
 
     def test_resolve_github_source_basic(self):
         """Test resolving basic GitHub source."""
-        sources = {
-            "my-source": SourceConfig(
-                type=SourceType.GITHUB,
-                repo="owner/repo",
-                path="skills",
-                branch="main",
-            )
-        }
+        sources = _SOURCES_BASIC
 
         result = resolve_source("my-source", sources, default_branch="develop")
 
@@ -133,13 +153,7 @@ class TestResolveSource:
 
     def test_resolve_source_uses_default_branch(self):
         """Test that source uses default branch when not specified."""
-        sources = {
-            "my-source": SourceConfig(
-                type=SourceType.GITHUB,
-                repo="owner/repo",
-                path="skills",
-            )
-        }
+        sources = _SOURCES_NO_BRANCH
 
         result = resolve_source("my-source", sources, default_branch="develop")
 
@@ -147,12 +161,7 @@ class TestResolveSource:
 
     def test_resolve_source_no_path(self):
         """Test resolving source without path."""
-        sources = {
-            "my-source": SourceConfig(
-                type=SourceType.GITHUB,
-                repo="owner/repo",
-            )
-        }
+        sources = _SOURCES_NO_PATH
 
         result = resolve_source("my-source", sources, default_branch="main")
 
@@ -187,14 +196,7 @@ class TestResolveComposeItem:
 
     def test_resolve_with_named_source(self):
         """Test resolving compose item with named source."""
-        sources = {
-            "my-source": SourceConfig(
-                type=SourceType.GITHUB,
-                repo="owner/repo",
-                path="skills",
-                branch="main",
-            )
-        }
+        sources = _SOURCES_BASIC
 
         item = ComposeItemConfig(
             source="my-source",
@@ -212,13 +214,7 @@ class TestResolveComposeItem:
 
     def test_resolve_with_named_source_no_base_path(self):
         """Test resolving when source has no base path."""
-        sources = {
-            "my-source": SourceConfig(
-                type=SourceType.GITHUB,
-                repo="owner/repo",
-                branch="main",
-            )
-        }
+        sources = _SOURCES_NO_PATH_MAIN
 
         item = ComposeItemConfig(
             source="my-source",
@@ -286,6 +282,19 @@ class TestResolveComposeItem:
         # Path should be expanded
         assert not str(result.local_path).startswith("~")
 
+    def test_resolve_local_path_keeps_symlinks(self, tmp_path):
+        """Test that local paths are normalized without resolving symlinks."""
+        (tmp_path / "real").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        item = ComposeItemConfig(
+            path=str(tmp_path / "link" / "sub" / ".." / "skill"),
+            level=PrecedenceLevel.DEFAULT,
+        )
+
+        result = resolve_compose_item(item, {}, default_branch="main")
+
+        assert result.local_path == tmp_path / "link" / "skill"
+
 
 class TestResolvedSource:
     """Test ResolvedSource dataclass."""
@@ -323,6 +332,14 @@ class TestResolvedSource:
         assert source.path is None
         assert source.ref is None
 
+    def test_equal_sources_hash_equal(self):
+        """Test that resolved sources are slotted and usable as dict keys."""
+        first = ResolvedSource(type="github", owner="owner", repo="repo", ref="main")
+        second = ResolvedSource(type="github", owner="owner", repo="repo", ref="main")
+
+        assert not hasattr(first, "__dict__")
+        assert {first: 1}[second] == 1
+
 
 class TestComplexResolutionScenarios:
     """Test complex resolution scenarios."""
@@ -365,6 +382,32 @@ class TestComplexResolutionScenarios:
         assert results[1].owner == "other"
         assert results[2].type == "local"
 
+    def test_resolve_compose_items_batch(self, monkeypatch):
+        """Test that batch resolution looks up each named source once."""
+        from skill_manager.core import resolver
+
+        calls = []
+        original = resolver.resolve_source
+
+        def counting_resolve_source(*args, **kwargs):
+            calls.append(args[0])
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(resolver, "resolve_source", counting_resolve_source)
+
+        items = [
+            ComposeItemConfig(source="my-source", skill="skill1"),
+            ComposeItemConfig(source="my-source", skill="skill2"),
+            ComposeItemConfig(path="/local/overrides", level=PrecedenceLevel.USER),
+        ]
+
+        results = resolve_compose_items(items, _SOURCES_BASIC, default_branch="main")
+
+        assert calls == ["my-source"]
+        assert [r.path for r in results[:2]] == ["skills/skill1", "skills/skill2"]
+        assert results[0].ref == results[1].ref == "main"
+        assert results[2].type == "local"
+
     def test_resolve_with_different_branches(self):
         """Test that different sources can have different branches."""
         sources = {
@@ -387,19 +430,3 @@ class TestComplexResolutionScenarios:
 
         assert stable_result.ref == "main"
         assert experimental_result.ref == "develop"
-
-    def test_url_parsing_edge_cases(self):
-        """Test URL parsing with various edge cases."""
-        # URL with single-letter components
-        url1 = "github.com/a/b/tree/c/d"
-        result1 = parse_github_url(url1)
-        assert result1.owner == "a"
-        assert result1.repo == "b"
-        assert result1.ref == "c"
-        assert result1.path == "d"
-
-        # URL with numeric components
-        url2 = "github.com/org123/repo456/tree/v1.2.3/skill789"
-        result2 = parse_github_url(url2)
-        assert result2.owner == "org123"
-        assert result2.ref == "v1.2.3"
@@ -1,7 +1,12 @@
 """Tests for Pydantic schema models and validation rules."""
 
+import json
+import random
+import re
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter
+from pydantic_core import ValidationError
 
 from skill_manager.config.schema import (
     ComposeItemConfig,
@@ -14,74 +19,254 @@ from skill_manager.config.schema import (
 )
 
 
+# Validation error messages, matched by several tests
+_REPO_ERR = re.compile(r"Repository must be in format")
+_EXACTLY_ONE_ERR = re.compile(r"Exactly one of source, path, or url")
+_BOTH_ERR = re.compile(r"cannot have both compose list and simple source")
+_NEITHER_ERR = re.compile(r"must have either compose list or one of source/path/url")
+_VERSION_ERR = re.compile(r"Unsupported config version")
+_FROZEN_ERR = re.compile(r"frozen")
+
+
+# Shared, immutable target dirs; SettingsConfig coerces them to a list
+_TARGET_DIRS = ("/path1", "/path2", "/path3")
+
+# Serialized config with one source and one skill, as read from a file
+_CONFIG_PAYLOAD = json.dumps(
+    {
+        "version": "1.0",
+        "sources": {
+            "test-source": {"type": "github", "repo": "owner/repo", "path": "skills"},
+        },
+        "skills": [{"name": "test-skill", "source": "test-source"}],
+    }
+).encode()
+
+
+def _config_from_json(raw: bytes) -> SkillManagerConfig:
+    """Parse and validate serialized config in one pass."""
+    return SkillManagerConfig.model_validate_json(raw)
+
+
+# Validators for raw config dicts, as they arrive from YAML; built once
+SOURCE_ADAPTER = TypeAdapter(SourceConfig)
+COMPOSE_ADAPTER = TypeAdapter(ComposeItemConfig)
+
+
+# Frozen, so safe to share between tests
+DEFAULT_COMPOSE_ITEM = ComposeItemConfig(path="/local/path")
+
+
+# Built once per session; tests using these must only read them. Fixtures
+# that only assemble already-validated child models use model_construct for
+# the top-level config, since validation is not what their tests check.
+@pytest.fixture(scope="session")
+def valid_github_source():
+    """Provide a fully specified GitHub source."""
+    return SourceConfig(
+        type=SourceType.GITHUB,
+        repo="owner/repo",
+        path="skills",
+        branch="main",
+    )
+
+
+@pytest.fixture(scope="session")
+def minimal_config():
+    """Provide a minimal configuration with no sources or skills."""
+    return SkillManagerConfig(
+        version="1.0",
+        settings=SettingsConfig(),
+        sources={},
+        skills=[],
+    )
+
+
+@pytest.fixture(scope="session")
+def config_with_sources_and_skills():
+    """Provide a configuration with one source and one skill using it."""
+    return _config_from_json(_CONFIG_PAYLOAD)
+
+
+# Characters for generated names, including non-ASCII and astral code points
+_NAME_ALPHABET = "abcXYZ019-_.éßΩ日本🙂"
+
+
+def _random_name(rng: random.Random, max_len: int) -> str:
+    """Generate a non-empty name without slashes."""
+    return "".join(rng.choices(_NAME_ALPHABET, k=rng.randint(1, max_len)))
+
+
+@pytest.fixture(scope="session")
+def source_corpus():
+    """Provide seeded SourceConfig inputs as (input_dict, is_valid) pairs.
+
+    Covers non-ASCII and very long repo names and paths. Generated in memory
+    once per session; the fixed seed keeps every run identical.
+    """
+    rng = random.Random(20240101)
+    corpus = []
+    for _ in range(10):
+        repo = f"{_random_name(rng, 100)}/{_random_name(rng, 100)}"
+        path = "/".join(_random_name(rng, 50) for _ in range(rng.randint(1, 80)))
+        corpus.append(({"type": "github", "repo": repo, "path": path}, True))
+    for _ in range(10):
+        parts = [_random_name(rng, 100) for _ in range(rng.choice((1, 3, 4)))]
+        corpus.append(({"type": "github", "repo": "/".join(parts)}, False))
+    return tuple(corpus)
+
+
+@pytest.fixture(scope="session")
+def empty_compose_error():
+    """Provide the errors() list from validating a skill with an empty compose list."""
+    with pytest.raises(ValidationError) as exc_info:
+        SkillConfig(name="invalid-skill", compose=[])
+    return exc_info.value.errors()
+
+
+@pytest.fixture(scope="session")
+def compose_items():
+    """Provide (default_item, override_url_item, override_path_item).
+
+    URL-only and path-only items are validated by TestComposeItemConfig, so
+    those two skip validation here.
+    """
+    return (
+        ComposeItemConfig(
+            source="github-source",
+            skill="base",
+            level=PrecedenceLevel.DEFAULT,
+        ),
+        ComposeItemConfig.model_construct(
+            url="https://github.com/org/repo/tree/main/skills/override",
+            level=PrecedenceLevel.USER,
+        ),
+        ComposeItemConfig.model_construct(
+            path="/local/override",
+            level=PrecedenceLevel.USER,
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def multi_level_skill(compose_items):
+    """Provide a skill composed from a named source, a URL and a local path."""
+    return SkillConfig(
+        name="complex-skill",
+        description="Complex composed skill",
+        compose=list(compose_items),
+    )
+
+
+@pytest.fixture(scope="session")
+def multi_skill_config(compose_items):
+    """Provide a configuration with simple, local and composed skills."""
+    return SkillManagerConfig.model_construct(
+        version="1.0",
+        sources={
+            "github-source": SourceConfig(
+                type=SourceType.GITHUB,
+                repo="owner/repo",
+            ),
+        },
+        skills=[
+            SkillConfig(name="simple-skill", source="github-source"),
+            SkillConfig(name="local-skill", path="/local/skill"),
+            SkillConfig(
+                name="composed-skill",
+                compose=[compose_items[0], compose_items[2]],
+            ),
+        ],
+    )
+
+
 class TestSettingsConfig:
     """Test SettingsConfig model."""
 
-    def test_default_values(self):
-        """Test that default values are set correctly."""
-        settings = SettingsConfig()
-        assert settings.target_dirs == [".claude/skills"]
-        assert settings.cache_dir == "~/.cache/skill-manager"
-        assert settings.default_branch == "main"
-
-    def test_custom_values(self):
-        """Test setting custom values."""
-        settings = SettingsConfig(
-            target_dirs=["/custom/path"],
-            cache_dir="/custom/cache",
-            default_branch="develop",
-        )
-        assert settings.target_dirs == ["/custom/path"]
-        assert settings.cache_dir == "/custom/cache"
-        assert settings.default_branch == "develop"
-
-    def test_multiple_target_dirs(self):
-        """Test multiple target directories."""
-        settings = SettingsConfig(target_dirs=["/path1", "/path2", "/path3"])
-        assert len(settings.target_dirs) == 3
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                {},
+                {
+                    "target_dirs": [".claude/skills"],
+                    "cache_dir": "~/.cache/skill-manager",
+                    "default_branch": "main",
+                },
+                id="defaults",
+            ),
+            pytest.param(
+                {
+                    "target_dirs": ["/custom/path"],
+                    "cache_dir": "/custom/cache",
+                    "default_branch": "develop",
+                },
+                {
+                    "target_dirs": ["/custom/path"],
+                    "cache_dir": "/custom/cache",
+                    "default_branch": "develop",
+                },
+                id="custom",
+            ),
+            pytest.param(
+                {"target_dirs": _TARGET_DIRS},
+                {"target_dirs": list(_TARGET_DIRS)},
+                id="multiple-target-dirs",
+            ),
+        ],
+    )
+    def test_settings(self, kwargs, expected):
+        """Test that settings take the given values and default the rest."""
+        settings = SettingsConfig(**kwargs)
+        for name, value in expected.items():
+            assert getattr(settings, name) == value
 
 
 class TestSourceConfig:
     """Test SourceConfig model."""
 
-    def test_valid_github_source(self):
+    def test_valid_github_source(self, valid_github_source):
         """Test creating a valid GitHub source."""
-        source = SourceConfig(
-            type=SourceType.GITHUB,
-            repo="owner/repo",
-            path="skills",
-            branch="main",
-        )
+        source = valid_github_source
         assert source.type == SourceType.GITHUB
         assert source.repo == "owner/repo"
         assert source.path == "skills"
         assert source.branch == "main"
 
-    def test_invalid_repo_format_no_slash(self):
-        """Test that repo without slash is invalid."""
-        with pytest.raises(ValidationError, match="Repository must be in format"):
-            SourceConfig(
-                type=SourceType.GITHUB,
-                repo="invalidrepo",
-            )
-
-    def test_invalid_repo_format_multiple_slashes(self):
-        """Test that repo with multiple slashes is invalid."""
-        with pytest.raises(ValidationError, match="Repository must be in format"):
-            SourceConfig(
-                type=SourceType.GITHUB,
-                repo="owner/repo/extra",
-            )
+    @pytest.mark.parametrize(
+        "repo",
+        [
+            pytest.param("invalidrepo", id="no-slash"),
+            pytest.param("owner/repo/extra", id="multiple-slashes"),
+        ],
+    )
+    def test_invalid_repo_format(self, repo):
+        """Test that repo must be exactly owner/repo."""
+        with pytest.raises(ValueError, match=_REPO_ERR):
+            SourceConfig.validate_repo_format(repo)
+
+    def test_repo_validator_returns_valid_repo(self):
+        """Test that the repo validator passes a well-formed repo through."""
+        assert SourceConfig.validate_repo_format("owner/repo") == "owner/repo"
 
     def test_optional_path_and_branch(self):
         """Test that path and branch are optional."""
-        source = SourceConfig(
-            type=SourceType.GITHUB,
-            repo="owner/repo",
-        )
+        source = SOURCE_ADAPTER.validate_python({"type": "github", "repo": "owner/repo"})
+        assert source.type == SourceType.GITHUB
         assert source.path is None
         assert source.branch is None
 
+    def test_generated_repo_names(self, source_corpus):
+        """Test repo validation on generated unicode and long inputs."""
+        for data, is_valid in source_corpus:
+            if is_valid:
+                source = SOURCE_ADAPTER.validate_python(data)
+                assert source.repo == data["repo"]
+                assert source.path == data["path"]
+            else:
+                with pytest.raises(ValidationError, match=_REPO_ERR):
+                    SOURCE_ADAPTER.validate_python(data)
+
 
 class TestComposeItemConfig:
     """Test ComposeItemConfig model."""
@@ -99,19 +284,18 @@ class TestComposeItemConfig:
 
     def test_path_only(self):
         """Test compose item with local path."""
-        item = ComposeItemConfig(
-            path="/local/path/to/skill",
-            level=PrecedenceLevel.USER,
+        item = COMPOSE_ADAPTER.validate_python(
+            {"path": "/local/path/to/skill", "level": "user"}
         )
+        assert item.level == PrecedenceLevel.USER
         assert item.path == "/local/path/to/skill"
         assert item.source is None
         assert item.url is None
 
     def test_url_only(self):
         """Test compose item with direct URL."""
-        item = ComposeItemConfig(
-            url="https://github.com/owner/repo/tree/main/skills/my-skill",
-            level=PrecedenceLevel.DEFAULT,
+        item = COMPOSE_ADAPTER.validate_python(
+            {"url": "https://github.com/owner/repo/tree/main/skills/my-skill"}
         )
         assert item.url == "https://github.com/owner/repo/tree/main/skills/my-skill"
         assert item.source is None
@@ -133,56 +317,47 @@ class TestComposeItemConfig:
 
     def test_multiple_sources_fails(self):
         """Test that multiple sources are not allowed."""
-        with pytest.raises(ValidationError, match="Exactly one of source, path, or url"):
-            ComposeItemConfig(
-                source="my-source",
-                skill="my-skill",
-                path="/local/path",
-                level=PrecedenceLevel.DEFAULT,
+        with pytest.raises(ValidationError, match=_EXACTLY_ONE_ERR):
+            COMPOSE_ADAPTER.validate_python(
+                {"source": "my-source", "skill": "my-skill", "path": "/local/path"}
             )
 
     def test_no_source_fails(self):
         """Test that at least one source is required."""
-        with pytest.raises(ValidationError, match="Exactly one of source, path, or url"):
-            ComposeItemConfig(level=PrecedenceLevel.DEFAULT)
+        with pytest.raises(ValidationError, match=_EXACTLY_ONE_ERR):
+            COMPOSE_ADAPTER.validate_python({"level": "default"})
 
     def test_default_precedence_level(self):
         """Test default precedence level is DEFAULT."""
-        item = ComposeItemConfig(path="/local/path")
-        assert item.level == PrecedenceLevel.DEFAULT
+        assert DEFAULT_COMPOSE_ITEM.level is PrecedenceLevel.DEFAULT
+
+    def test_compose_item_is_frozen(self):
+        """Test that compose items cannot be modified after validation."""
+        with pytest.raises(ValidationError, match=_FROZEN_ERR):
+            DEFAULT_COMPOSE_ITEM.level = PrecedenceLevel.USER
 
 
 class TestSkillConfig:
     """Test SkillConfig model."""
 
-    def test_simple_skill_with_source(self):
-        """Test simple skill with named source."""
-        skill = SkillConfig(
-            name="my-skill",
-            source="my-source",
-            description="A test skill",
-        )
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            pytest.param("source", "my-source", id="source"),
+            pytest.param("path", "/local/path/to/skill", id="path"),
+            pytest.param(
+                "url",
+                "https://github.com/owner/repo/tree/main/skills/my-skill",
+                id="url",
+            ),
+        ],
+    )
+    def test_simple_skill(self, field, value):
+        """Test simple skill with a single named source, local path or URL."""
+        skill = SkillConfig(name="my-skill", description="A test skill", **{field: value})
         assert skill.name == "my-skill"
-        assert skill.source == "my-source"
         assert skill.description == "A test skill"
-        assert skill.compose is None
-
-    def test_simple_skill_with_path(self):
-        """Test simple skill with local path."""
-        skill = SkillConfig(
-            name="my-skill",
-            path="/local/path/to/skill",
-        )
-        assert skill.path == "/local/path/to/skill"
-        assert skill.compose is None
-
-    def test_simple_skill_with_url(self):
-        """Test simple skill with direct URL."""
-        skill = SkillConfig(
-            name="my-skill",
-            url="https://github.com/owner/repo/tree/main/skills/my-skill",
-        )
-        assert skill.url == "https://github.com/owner/repo/tree/main/skills/my-skill"
+        assert getattr(skill, field) == value
         assert skill.compose is None
 
     def test_composed_skill(self):
@@ -209,10 +384,7 @@ class TestSkillConfig:
 
     def test_skill_with_both_simple_and_compose_fails(self):
         """Test that skill cannot have both simple source and compose."""
-        with pytest.raises(
-            ValidationError,
-            match="cannot have both compose list and simple source",
-        ):
+        with pytest.raises(ValidationError, match=_BOTH_ERR):
             SkillConfig(
                 name="invalid-skill",
                 source="my-source",
@@ -223,65 +395,41 @@ class TestSkillConfig:
 
     def test_skill_with_neither_simple_nor_compose_fails(self):
         """Test that skill must have either simple source or compose."""
-        with pytest.raises(
-            ValidationError,
-            match="must have either compose list or one of source/path/url",
-        ):
+        with pytest.raises(ValidationError, match=_NEITHER_ERR):
             SkillConfig(name="invalid-skill")
 
-    def test_empty_compose_list_fails(self):
+    def test_empty_compose_list_fails(self, empty_compose_error):
         """Test that empty compose list is invalid."""
-        with pytest.raises(
-            ValidationError,
-            match="must have either compose list or one of source/path/url",
-        ):
-            SkillConfig(
-                name="invalid-skill",
-                compose=[],
-            )
+        assert len(empty_compose_error) == 1
+        assert _NEITHER_ERR.search(empty_compose_error[0]["msg"])
 
 
 class TestSkillManagerConfig:
     """Test SkillManagerConfig model."""
 
-    def test_minimal_valid_config(self):
+    def test_minimal_valid_config(self, minimal_config):
         """Test minimal valid configuration."""
-        config = SkillManagerConfig(
-            version="1.0",
-            settings=SettingsConfig(),
-            sources={},
-            skills=[],
-        )
+        config = minimal_config
         assert config.version == "1.0"
-        assert isinstance(config.settings, SettingsConfig)
+        assert type(config.settings) is SettingsConfig
         assert config.sources == {}
         assert config.skills == []
 
-    def test_config_with_sources_and_skills(self):
+    def test_config_with_sources_and_skills(self, config_with_sources_and_skills):
         """Test configuration with sources and skills."""
-        config = SkillManagerConfig(
-            version="1.0",
-            sources={
-                "test-source": SourceConfig(
-                    type=SourceType.GITHUB,
-                    repo="owner/repo",
-                    path="skills",
-                ),
-            },
-            skills=[
-                SkillConfig(
-                    name="test-skill",
-                    source="test-source",
-                ),
-            ],
-        )
+        config = config_with_sources_and_skills
         assert "test-source" in config.sources
         assert len(config.skills) == 1
         assert config.skills[0].name == "test-skill"
 
+    def test_json_round_trip(self, config_with_sources_and_skills):
+        """Test that a config survives serialization to JSON and back."""
+        raw = config_with_sources_and_skills.model_dump_json().encode()
+        assert _config_from_json(raw) == config_with_sources_and_skills
+
     def test_version_validation_invalid_major(self):
         """Test that version must start with 1."""
-        with pytest.raises(ValidationError, match="Unsupported config version"):
+        with pytest.raises(ValidationError, match=_VERSION_ERR):
             SkillManagerConfig(
                 version="2.0",
             )
@@ -294,70 +442,33 @@ class TestSkillManagerConfig:
     def test_default_settings_created(self):
         """Test that default settings are created if not provided."""
         config = SkillManagerConfig(version="1.0")
-        assert isinstance(config.settings, SettingsConfig)
+        assert type(config.settings) is SettingsConfig
         assert config.settings.default_branch == "main"
 
     def test_precedence_level_enum_values(self):
         """Test that PrecedenceLevel enum has correct values."""
-        assert PrecedenceLevel.DEFAULT.value == "default"
-        assert PrecedenceLevel.USER.value == "user"
+        assert PrecedenceLevel("default") is PrecedenceLevel.DEFAULT
+        assert PrecedenceLevel("user") is PrecedenceLevel.USER
 
     def test_source_type_enum_values(self):
         """Test that SourceType enum has correct values."""
-        assert SourceType.GITHUB.value == "github"
+        assert SourceType("github") is SourceType.GITHUB
 
 
 class TestComplexSkillScenarios:
     """Test complex skill configuration scenarios."""
 
-    def test_multi_level_composed_skill(self):
+    def test_multi_level_composed_skill(self, multi_level_skill):
         """Test skill composed from multiple precedence levels."""
-        skill = SkillConfig(
-            name="complex-skill",
-            description="Complex composed skill",
-            compose=[
-                ComposeItemConfig(
-                    source="base-source",
-                    skill="base-skill",
-                    level=PrecedenceLevel.DEFAULT,
-                ),
-                ComposeItemConfig(
-                    url="https://github.com/org/repo/tree/main/skills/override",
-                    level=PrecedenceLevel.USER,
-                ),
-                ComposeItemConfig(
-                    path="/local/custom",
-                    level=PrecedenceLevel.USER,
-                ),
-            ],
-        )
+        skill = multi_level_skill
         assert len(skill.compose) == 3
         assert skill.compose[0].level == PrecedenceLevel.DEFAULT
         assert skill.compose[1].level == PrecedenceLevel.USER
         assert skill.compose[2].level == PrecedenceLevel.USER
 
-    def test_config_with_multiple_skills(self):
+    def test_config_with_multiple_skills(self, multi_skill_config):
         """Test configuration with multiple skills of different types."""
-        config = SkillManagerConfig(
-            version="1.0",
-            sources={
-                "github-source": SourceConfig(
-                    type=SourceType.GITHUB,
-                    repo="owner/repo",
-                ),
-            },
-            skills=[
-                SkillConfig(name="simple-skill", source="github-source"),
-                SkillConfig(name="local-skill", path="/local/skill"),
-                SkillConfig(
-                    name="composed-skill",
-                    compose=[
-                        ComposeItemConfig(source="github-source", skill="base"),
-                        ComposeItemConfig(path="/local/override"),
-                    ],
-                ),
-            ],
-        )
+        config = multi_skill_config
         assert len(config.skills) == 3
         assert config.skills[0].source == "github-source"
         assert config.skills[1].path == "/local/skill"